@@ -0,0 +1,134 @@
+"""Load the game's audio on a background thread, caching decoded sound effects
+
+AssetLoader starts the music and loads the sound effects on its own thread,
+so the menu is on screen and responsive while audio is still loading. The
+music streams from its MP3 (pygame.mixer.music decodes as it plays). Each
+sound effect is decoded once and its raw PCM is written to assets/decoded/,
+named by the source file's hash and the mixer format, so later launches
+only read samples back instead of decoding MP3. A changed source file or
+mixer format gets a new cache file, and the stale one is removed.
+
+Game sounds go through a SoundBank, which plays a sound only once it has
+loaded, so the game can start before loading is done.
+"""
+import hashlib
+import threading
+from pathlib import Path
+
+import pygame
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+CACHE_DIR = ASSETS_DIR / "decoded"
+
+# Sound effect files by game event
+SOUND_FILES = {
+    "placed": "bloop-short.mp3",
+    "line_clear": "debris-break.mp3",
+}
+MUSIC_FILE = "intro-theme.mp3"
+MUSIC_VOLUME = 0.3
+
+
+def source_hash(path):
+    """Short hash of a file's contents"""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=8).hexdigest()
+
+
+def cache_path(path, cache_dir, mixer_format):
+    """Where the decoded PCM of path is cached for a mixer format (frequency, size, channels)"""
+    frequency, size, channels = mixer_format
+    return Path(cache_dir) / f"{Path(path).stem}-{source_hash(path)}-{frequency}-{size}-{channels}.pcm"
+
+
+def load_sound(path, cache_dir=CACHE_DIR):
+    """Load a Sound from its decoded cache, or decode it and write the cache
+
+    Raises pygame.error when the mixer is not initialized or the file cannot
+    be decoded. Failing to write the cache only skips caching.
+    """
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        raise pygame.error("mixer not initialized")
+    cached = cache_path(path, cache_dir, mixer_format)
+    try:
+        return pygame.mixer.Sound(buffer=cached.read_bytes())
+    except FileNotFoundError:
+        pass
+
+    sound = pygame.mixer.Sound(str(path))
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        partial = cached.with_suffix(".part")
+        partial.write_bytes(sound.get_raw())
+        partial.replace(cached)  # Never leave a truncated cache file behind
+        for stale in cached.parent.glob(f"{Path(path).stem}-*.pcm"):
+            if stale != cached:
+                stale.unlink()
+    except OSError as e:
+        print(f"Error caching decoded {Path(path).name}: {e}")
+    return sound
+
+
+class SoundBank:
+    """Sound effects by name, filled in as they load
+
+    get() returns None and play() does nothing for a sound that is not
+    loaded (yet, or at all). `ready` is set once loading has finished.
+    """
+
+    def __init__(self, sounds=None):
+        self.sounds = dict(sounds or {})
+        self.ready = threading.Event()
+
+    def __contains__(self, name):
+        return name in self.sounds
+
+    def get(self, name, default=None):
+        return self.sounds.get(name, default)
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.play()
+
+
+class AssetLoader:
+    """Background thread that starts the music, then loads the sound effects into `sounds`"""
+
+    def __init__(self, assets_dir=ASSETS_DIR, cache_dir=CACHE_DIR, sound_files=SOUND_FILES,
+                 music_file=MUSIC_FILE, music_volume=MUSIC_VOLUME):
+        self.assets_dir = Path(assets_dir)
+        self.cache_dir = cache_dir
+        self.sound_files = sound_files
+        self.music_file = music_file
+        self.music_volume = music_volume
+        self.sounds = SoundBank()
+        self.thread = threading.Thread(target=self.run, name="asset-loader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        """Block until loading has finished; True if it has"""
+        return self.sounds.ready.wait(timeout)
+
+    def run(self):
+        try:
+            if self.music_file:
+                self._start_music()
+            for name, filename in self.sound_files.items():
+                try:
+                    self.sounds.sounds[name] = load_sound(self.assets_dir / filename, self.cache_dir)
+                except (pygame.error, OSError) as e:
+                    print(f"Error loading sound {filename}: {e}")
+        finally:
+            self.sounds.ready.set()
+
+    def _start_music(self):
+        try:
+            pygame.mixer.music.load(str(self.assets_dir / self.music_file))
+            pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.music.play(-1)
+        except pygame.error as e:
+            print(f"Error playing music {self.music_file}: {e}")
@@ -0,0 +1,186 @@
+"""Vectorized engine that steps many independent games in lockstep with NumPy
+
+Every board follows the same rules as `tetris_core.Game.step`, so a batch
+seeded with `seeds` gives exactly the games `Game(rng=random.Random(seed))`
+would play for the same actions.
+
+Usage: python batch_sim.py --boards 4096 --steps 1000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from tetris_core import (
+    COLORS, PIECES, PIECE_SHAPES,
+    NOOP, MOVE_LEFT, MOVE_RIGHT, MOVE_DOWN, ROTATE, HARD_DROP,
+)
+
+# Cell offsets for every (type, rotation), padded to 4 rotations: CELL_DX/DY[type, rotation, cell]
+CELL_DX = np.zeros((len(PIECES), 4, 4), dtype=np.int32)
+CELL_DY = np.zeros((len(PIECES), 4, 4), dtype=np.int32)
+for _type, _shapes in enumerate(PIECE_SHAPES):
+    for _rotation in range(4):
+        _shape = _shapes[_rotation % len(_shapes)]
+        CELL_DX[_type, _rotation] = [dx for dx, _ in _shape.cells]
+        CELL_DY[_type, _rotation] = [dy for _, dy in _shape.cells]
+
+ROTATION_COUNTS = np.array([len(rotations) for rotations in PIECES], dtype=np.int32)
+
+
+class BatchGame:
+    """B games stored as one (B, height, width) array of color indices"""
+
+    def __init__(self, seeds, width=10, height=20):
+        self.width = width
+        self.height = height
+        self.size = len(seeds)
+        self.rngs = [random.Random(seed) for seed in seeds]
+
+        self.grid = np.zeros((self.size, height, width), dtype=np.uint8)
+        self.score = np.zeros(self.size, dtype=np.int64)
+        self.lines = np.zeros(self.size, dtype=np.int64)
+        self.pieces_placed = np.zeros(self.size, dtype=np.int64)
+        self.alive = np.ones(self.size, dtype=bool)
+
+        # Current and next piece of every board
+        self.type = np.zeros(self.size, dtype=np.int32)
+        self.color = np.zeros(self.size, dtype=np.int32)
+        self.rotation = np.zeros(self.size, dtype=np.int32)
+        self.x = np.zeros(self.size, dtype=np.int32)
+        self.y = np.zeros(self.size, dtype=np.int32)
+        self.next_type = np.zeros(self.size, dtype=np.int32)
+        self.next_color = np.zeros(self.size, dtype=np.int32)
+
+        # Same draw order as Game.spawn_new_piece: first the initial next piece
+        for b in range(self.size):
+            self.next_type[b], self.next_color[b] = self._draw_piece(b)
+        self._spawn(np.arange(self.size))
+
+    def _draw_piece(self, b):
+        """Draw a (type, color) pair the way Piece.__init__ does"""
+        rng = self.rngs[b]
+        return rng.randint(0, len(PIECES) - 1), rng.randint(1, len(COLORS) - 1)
+
+    def _spawn(self, idx):
+        """Promote the next piece to current for boards idx and check for game over"""
+        self.type[idx] = self.next_type[idx]
+        self.color[idx] = self.next_color[idx]
+        self.rotation[idx] = 0
+        self.x[idx] = 3
+        self.y[idx] = 0
+        for b in idx:
+            self.next_type[b], self.next_color[b] = self._draw_piece(b)
+
+        blocked = self._collides(idx, self.x[idx], self.y[idx], self.rotation[idx])
+        self.alive[idx[blocked]] = False
+
+    def _collides(self, idx, x, y, rotation):
+        """Vectorized Board.collides for boards idx with the given piece positions"""
+        cx = x[:, None] + CELL_DX[self.type[idx], rotation]
+        cy = y[:, None] + CELL_DY[self.type[idx], rotation]
+        outside = (cx < 0) | (cx >= self.width) | (cy >= self.height)
+        filled = self.grid[
+            idx[:, None],
+            np.clip(cy, 0, self.height - 1),
+            np.clip(cx, 0, self.width - 1),
+        ] > 0
+        return (outside | ((cy >= 0) & filled)).any(axis=1)
+
+    def _try_move(self, idx, dx, dy):
+        """Move pieces of boards idx where possible; return which moved"""
+        x, y = self.x[idx] + dx, self.y[idx] + dy
+        ok = ~self._collides(idx, x, y, self.rotation[idx])
+        self.x[idx[ok]] = x[ok]
+        self.y[idx[ok]] = y[ok]
+        return ok
+
+    def _rotate(self, idx):
+        rotation = (self.rotation[idx] + 1) % ROTATION_COUNTS[self.type[idx]]
+        ok = ~self._collides(idx, self.x[idx], self.y[idx], rotation)
+        self.rotation[idx[ok]] = rotation[ok]
+
+    def _drop(self, idx):
+        """Move pieces of boards idx down until they all land"""
+        while len(idx):
+            idx = idx[self._try_move(idx, 0, 1)]
+
+    def _freeze(self, idx):
+        """Place the current pieces, clear lines, score and spawn for boards idx"""
+        if not len(idx):
+            return np.zeros(0, dtype=np.int64)
+
+        rotation = self.rotation[idx]
+        cx = self.x[idx, None] + CELL_DX[self.type[idx], rotation]
+        cy = self.y[idx, None] + CELL_DY[self.type[idx], rotation]
+        visible = cy >= 0
+        rows = np.broadcast_to(idx[:, None], cx.shape)
+        self.grid[rows[visible], cy[visible], cx[visible]] = np.broadcast_to(
+            self.color[idx, None], cx.shape)[visible]
+        self.pieces_placed[idx] += 1
+
+        # Clear full rows: full rows sort to the top (stably) and are then emptied
+        full = (self.grid[idx] > 0).all(axis=2)
+        lines = full.sum(axis=1)
+        cleared = idx[lines > 0]
+        if len(cleared):
+            full = full[lines > 0]
+            order = np.argsort(~full, axis=1, kind="stable")
+            grid = np.take_along_axis(self.grid[cleared], order[:, :, None], axis=1)
+            grid[np.arange(self.height)[None, :] < lines[lines > 0][:, None]] = 0
+            self.grid[cleared] = grid
+
+        self.lines[idx] += lines
+        self.score[idx] += lines ** 2
+        self._spawn(idx)
+        return lines
+
+    def step(self, actions):
+        """Apply one action per board (tetris_core action codes), then tick every live board"""
+        actions = np.asarray(actions)
+        live = self.alive.copy()
+
+        self._try_move(np.flatnonzero(live & (actions == MOVE_LEFT)), -1, 0)
+        self._try_move(np.flatnonzero(live & (actions == MOVE_RIGHT)), 1, 0)
+        self._try_move(np.flatnonzero(live & (actions == MOVE_DOWN)), 0, 1)
+        self._rotate(np.flatnonzero(live & (actions == ROTATE)))
+
+        dropping = np.flatnonzero(live & (actions == HARD_DROP))
+        self._drop(dropping)
+        self._freeze(dropping)
+
+        # Gravity for everyone that did not hard drop
+        ticking = np.flatnonzero(live & (actions != HARD_DROP))
+        landed = ticking[~self._try_move(ticking, 0, 1)]
+        self._freeze(landed)
+
+    def board(self, b):
+        """Get board b as a list-of-lists grid like Board.grid"""
+        return self.grid[b].tolist()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vectorized batch Tetris simulation")
+    parser.add_argument("--boards", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    batch = BatchGame(range(args.seed, args.seed + args.boards))
+    actions_rng = np.random.default_rng(args.seed)
+    moves = np.array([NOOP, MOVE_LEFT, MOVE_RIGHT, MOVE_DOWN, ROTATE, HARD_DROP])
+
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        batch.step(actions_rng.choice(moves, size=args.boards))
+    elapsed = time.perf_counter() - start
+
+    board_steps = args.boards * args.steps
+    print(f"{board_steps} board steps in {elapsed:.3f}s ({board_steps / elapsed:.0f} steps/sec)")
+    print(f"{int(batch.pieces_placed.sum())} pieces, {int(batch.lines.sum())} lines, "
+          f"{int(batch.alive.sum())}/{args.boards} games still running")
+
+
+if __name__ == "__main__":
+    main()
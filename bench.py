@@ -0,0 +1,301 @@
+"""Micro and macro benchmarks for the engine and renderer, with a baseline comparison
+
+Micro benchmarks time single operations on the real classes: each board
+backend's collides, place_piece, clear_lines (0 to 4 full lines) and
+drop_to_bottom, the bot's best_placement with and without lookahead, plus
+draw_board, draw_piece and Menu.draw. Macro benchmarks time whole
+simulated games and whole game frames (draw_game) at several board
+sizes, including a giant board drawn through a scrolling viewport.
+Rendering uses SDL's dummy video driver, so no window opens.
+
+Each benchmark runs `number` calls per sample, `repeat` samples, with any
+per-call setup (fresh boards and pieces) done outside the timed loop.
+Results are seconds per call; --output writes them as JSON and --compare
+reports the change against such a file, exiting with status 1 when a
+benchmark got slower by more than --threshold. Benchmarks with a budget
+in BUDGETS (two-piece lookahead must stay under a millisecond per
+decision) fail the run whenever their best sample goes over it.
+
+Usage: python bench.py --output baseline.json
+       python bench.py --compare baseline.json --threshold 0.15
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from itertools import cycle
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from tetris_core import PIECES, Board, Piece
+from simulate import BOARDS, random_policy, play_game
+from placements import best_placement
+
+# Boards drawn by the frame benchmarks: (width, height, block size) fitting the window
+FRAME_SIZES = ((10, 20, 20), (20, 40, 10), (40, 80, 5))
+# Board drawn through a viewport by the large frame benchmark
+LARGE_BOARD = (300, 3000)
+LEADERBOARD = [{"name": f"player{i}", "score": 5000 - 700 * i} for i in range(5)]
+# Most seconds per call a benchmark's best sample may take, baseline or not
+BUDGETS = {"micro/best_placement_lookahead": 1e-3}
+
+
+def junk_board(board_cls, width=10, height=20, stack=8, full_lines=0, seed=0):
+    """A board with `stack` rows of random junk (each with a hole) and `full_lines` full rows below"""
+    rng = random.Random(seed)
+    board = board_cls(width, height)
+    for y in range(height - stack - full_lines, height - full_lines):
+        row = [rng.randint(1, 7) if rng.random() < 0.7 else 0 for _ in range(width)]
+        row[rng.randrange(width)] = 0
+        board.grid[y] = row
+    for y in range(height - full_lines, height):
+        board.grid[y] = [rng.randint(1, 7) for _ in range(width)]
+    resync(board)
+    return board
+
+
+def copy_board(board):
+    copy = type(board)(board.width, board.height)
+    for y, row in enumerate(board.grid):
+        copy.grid[y] = row[:]
+    resync(copy)
+    return copy
+
+
+def resync(board):
+    if hasattr(board, "sync_rows"):
+        board.sync_rows()
+    else:
+        board.sync_heights()
+
+
+def landed_pieces(board):
+    """Every piece type at every column, moved down to where it would land"""
+    pieces = []
+    for piece_type in range(len(PIECES)):
+        for x in range(-1, board.width):
+            piece = Piece(x, 0, piece_type=piece_type, color=1)
+            if not board.collides(piece):
+                piece.drop_to_bottom(board)
+                pieces.append(piece)
+    return pieces
+
+
+def engine_benchmarks():
+    """(name, op, make_args, number) for the board operations on each backend and the bot's move search"""
+    for board_name, board_cls in BOARDS.items():
+        board = junk_board(board_cls)
+        probes = cycle([Piece(piece.x, piece.y + dy, piece_type=piece.type, color=1)
+                        for piece in landed_pieces(board) for dy in (-4, -1, 0, 1)])
+        yield (f"micro/collides[{board_name}]", board_cls.collides,
+               lambda board=board, probes=probes: (board, next(probes)), 20000)
+
+        landed = cycle(landed_pieces(board))
+        yield (f"micro/place_piece[{board_name}]", board_cls.place_piece,
+               lambda board=board, landed=landed: (copy_board(board), next(landed)), 5000)
+
+        for lines in range(5):
+            template = junk_board(board_cls, stack=8 - lines, full_lines=lines)
+            yield (f"micro/clear_lines_{lines}[{board_name}]", board_cls.clear_lines,
+                   lambda template=template: (copy_board(template),), 5000)
+
+        spawns = cycle([(piece.x, piece.type) for piece in landed_pieces(board)])
+        yield (f"micro/drop_to_bottom[{board_name}]", Piece.drop_to_bottom,
+               lambda board=board, spawns=spawns: (_spawned(*next(spawns)), board), 20000)
+
+    # Bot decisions on boards a few pieces into seeded games
+    games = [play_game(random_policy, seed, max_pieces=15) for seed in range(20)]
+    games = cycle([game for game in games if game.state == "playing"])
+    yield "micro/best_placement", best_placement, lambda: (next(games), False), 500
+    yield "micro/best_placement_lookahead", best_placement, lambda: (next(games), True), 100
+
+
+def _spawned(x, piece_type):
+    return Piece(x, 0, piece_type=piece_type, color=1)
+
+
+def game_benchmarks():
+    """(name, op, make_args, number) for whole seeded games with the random policy"""
+    for board_name, board_cls in BOARDS.items():
+        seeds = iter(range(10 ** 9))
+        yield (f"macro/game[{board_name}]",
+               lambda seed, board_cls=board_cls: play_game(random_policy, seed, board_cls=board_cls),
+               lambda seeds=seeds: (next(seeds),), 50)
+
+
+def render_benchmarks():
+    """(name, op, make_args, number) for the drawing functions and whole frames"""
+    import pygame
+    import Tetris
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.get_surface() or pygame.display.set_mode(Tetris.WINDOW_SIZE)
+    start_x, start_y, preview_x, preview_y = 100, 60, 350, 100
+
+    game = _junk_game(Tetris.Game, 10, 20)
+    yield ("micro/draw_board", Tetris.draw_board,
+           lambda: (screen, game.board, start_x, start_y, preview_x, preview_y, 20, game.theme), 500)
+    yield ("micro/draw_piece", Tetris.draw_piece,
+           lambda: (screen, game.current_piece, start_x, start_y, 20, game.theme), 20000)
+    menu = Tetris.Menu()
+    yield "micro/menu_draw", menu.draw, lambda: (screen,), 500
+
+    for width, height, block_size in FRAME_SIZES:
+        game = _junk_game(Tetris.Game, width, height)
+        yield (f"macro/frame[{width}x{height}]", Tetris.draw_game,
+               lambda game=game, block_size=block_size: (screen, game, LEADERBOARD, start_x, start_y,
+                                                          preview_x, preview_y, block_size), 200)
+
+    width, height = LARGE_BOARD
+    block_size, view = Tetris.board_layout(width, height)
+    game = _junk_game(Tetris.Game, width, height, BOARDS["chunked"])
+    view.follow(game.current_piece, game.board)
+    yield (f"macro/frame[{width}x{height} view]", Tetris.draw_game,
+           lambda: (screen, game, LEADERBOARD, start_x, start_y, preview_x, preview_y, block_size,
+                    0, None, Tetris.NULL_PROFILER, view), 200)
+
+
+def _junk_game(game_cls, width, height, board_cls=Board):
+    game = game_cls(width, height, seed=0, board_cls=board_cls)
+    game.board = junk_board(type(game.board), width, height, stack=height // 2)
+    return game
+
+
+GROUPS = {
+    "engine": engine_benchmarks,
+    "game": game_benchmarks,
+    "render": render_benchmarks,
+}
+
+
+def time_op(op, make_args, number, repeat):
+    """Seconds per call of op(*args) for `repeat` samples of `number` calls, each with fresh args"""
+    op(*make_args())  # Warm up caches (fonts, layers, row masks) outside the samples
+    samples = []
+    for _ in range(repeat):
+        calls = [make_args() for _ in range(number)]
+        gc.disable()  # Like timeit: collections triggered by the setup would land in the sample
+        try:
+            start = time.perf_counter()
+            for args in calls:
+                op(*args)
+            samples.append((time.perf_counter() - start) / number)
+        finally:
+            gc.enable()
+    return samples
+
+
+def run_benchmarks(groups=GROUPS, name_filter="", repeat=5, scale=1.0):
+    """Run every benchmark whose name contains name_filter; returns {name: result}"""
+    results = {}
+    for group in groups.values():
+        for name, op, make_args, number in group():
+            if name_filter not in name:
+                continue
+            number = max(1, int(number * scale))
+            samples = time_op(op, make_args, number, repeat)
+            results[name] = {
+                "best": min(samples),
+                "median": statistics.median(samples),
+                "number": number,
+                "samples": samples,
+            }
+    return results
+
+
+def metadata():
+    import pygame
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pygame": pygame.version.ver,
+    }
+
+
+def compare(results, baseline, threshold=0.25):
+    """Rows of (name, baseline seconds, current seconds, change) and the names that regressed
+
+    Compares the best sample, the least noisy figure; change is the relative
+    difference (0.2 means 20% slower). Benchmarks missing from either side are skipped.
+    """
+    rows = []
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["best"]
+        after = result["best"]
+        change = after / before - 1
+        rows.append((name, before, after, change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def over_budget(results, budgets=BUDGETS):
+    """(name, seconds, budget) for every benchmark whose best sample is over its budget"""
+    return [(name, results[name]["best"], budget) for name, budget in budgets.items()
+            if name in results and results[name]["best"] > budget]
+
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Tetris engine and renderer")
+    parser.add_argument("--group", choices=GROUPS, action="append", help="only run these groups")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument("--quick", action="store_true", help="10x fewer calls per sample")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown (0.25 = 25%%) that counts as a regression with --compare")
+    args = parser.parse_args(argv)
+
+    groups = {name: GROUPS[name] for name in args.group} if args.group else GROUPS
+    results = run_benchmarks(groups, args.filter, args.repeat, 0.1 if args.quick else 1.0)
+    for name, result in results.items():
+        print(f"{name:32} best {format_seconds(result['best']):>10}  "
+              f"median {format_seconds(result['median']):>10}  ({1 / result['best']:,.0f}/sec)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": metadata(), "benchmarks": results}, f, indent=2)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["benchmarks"]
+        rows, regressions = compare(results, baseline, args.threshold)
+        print(f"\nCompared with {args.compare} (best of {args.repeat}):")
+        for name, before, after, change in rows:
+            flag = "  REGRESSION" if name in regressions else ""
+            print(f"{name:32} {format_seconds(before):>10} -> {format_seconds(after):>10}  {change:+.1%}{flag}")
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower by more than {args.threshold:.0%}")
+
+    over = over_budget(results)
+    for name, seconds, budget in over:
+        print(f"{name} took {format_seconds(seconds)}, over its {format_seconds(budget)} budget")
+    if over or regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Measure cold start: time to import Tetris, until main() shows its first frame, and
+until the main loop draws its first frame (the game takes input from then on)
+
+Every run is a fresh interpreter, so module caches do not hide import cost.
+The game runs offline with SDL's dummy video and audio drivers and quits
+right after the first frame reaches the display.
+
+Usage: python bench_startup.py --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import Tetris
+print(time.perf_counter() - start)
+"""
+
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import pygame
+import Tetris
+
+def first_frame(*args):
+    print(time.perf_counter() - start)
+    raise SystemExit
+
+pygame.display.flip = pygame.display.update = first_frame
+Tetris.main(offline=OFFLINE)
+"""
+
+INTERACTIVE_SCRIPT = """
+import time
+start = time.perf_counter()
+import pygame
+import Tetris
+
+frames = 0
+
+def frame(*args):
+    global frames
+    frames += 1
+    if frames == 2:  # The first is the menu shown before loading
+        print(time.perf_counter() - start)
+        raise SystemExit
+
+pygame.display.flip = pygame.display.update = frame
+Tetris.main(offline=OFFLINE)
+"""
+
+
+def run_script(script, offline=True):
+    """Run a timing script in a fresh interpreter and return the seconds it printed"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    script = script.replace("OFFLINE", str(offline))
+    result = subprocess.run([sys.executable, "-c", script], cwd=BASE_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.split()[-1])
+
+
+def measure(runs=5, offline=True):
+    """Timings in seconds over `runs` fresh processes: {"import", "first_frame", "interactive": [...]}"""
+    return {
+        "import": [run_script(IMPORT_SCRIPT, offline) for _ in range(runs)],
+        "first_frame": [run_script(FIRST_FRAME_SCRIPT, offline) for _ in range(runs)],
+        "interactive": [run_script(INTERACTIVE_SCRIPT, offline) for _ in range(runs)],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Tetris startup time")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per measurement")
+    parser.add_argument("--online", action="store_true", help="let main() create the leaderboard client")
+    args = parser.parse_args(argv)
+
+    timings = measure(args.runs, offline=not args.online)
+    for name, values in timings.items():
+        print(f"{name:>12}: median {statistics.median(values) * 1000:.1f} ms, "
+              f"min {min(values) * 1000:.1f} ms over {len(values)} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Keyboard input for play: key dispatch, DAS/ARR auto-shift and timestamped input
+
+Keys map to game actions through a table built from the keybinds. Key
+presses and releases are queued with the time they happened, and update()
+applies everything that happened up to a given time, in time order. The
+main loop calls it with each logic tick's time before running that tick,
+so inputs land on the tick they belong to even when a frame runs several
+ticks.
+
+Holding left or right moves once, then again after the DAS delay, then
+every ARR seconds (ARR 0 moves straight to the wall). Repeats are timed
+from the press, not counted in frames, so they are the same at any frame
+rate. When both are held the most recent press wins. Soft drop is held
+state (`soft_drop`), toggled in time order with the other inputs.
+
+Times are in seconds on any clock, as long as key events and update() use
+the same one.
+"""
+from collections import deque
+
+from tetris_core import MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+from replay import SOFT_DROP_ON, SOFT_DROP_OFF
+
+# Delayed auto shift: seconds a sideways key is held before it repeats
+DAS = 0.167
+# Auto repeat rate: seconds between repeats once DAS has charged (0: straight to the wall)
+ARR = 0.033
+# Most moves one ARR 0 shift makes (wider than any board)
+MAX_SHIFT = 1000
+
+# Keybind name -> action sent to the game (soft drop sends SOFT_DROP_ON and, on release, SOFT_DROP_OFF)
+BINDING_ACTIONS = {
+    "move_left": MOVE_LEFT,
+    "move_right": MOVE_RIGHT,
+    "rotate": ROTATE,
+    "hard_drop": HARD_DROP,
+    "move_down": SOFT_DROP_ON,
+}
+
+SHIFTS = (MOVE_LEFT, MOVE_RIGHT)
+
+
+def dispatch_table(keybinds):
+    """{key: action} for the bound keys"""
+    return {keybinds[name]: action for name, action in BINDING_ACTIONS.items() if name in keybinds}
+
+
+def event_time(event, fallback):
+    """When a key event happened in seconds: its SDL timestamp when pygame provides one, else fallback"""
+    timestamp = getattr(event, "timestamp", None)
+    return fallback if timestamp is None else timestamp / 1000
+
+
+class InputEngine:
+    """Turns timestamped key presses and releases into game actions, with DAS/ARR auto-shift"""
+
+    def __init__(self, keybinds, das=DAS, arr=ARR):
+        self.table = dispatch_table(keybinds)
+        self.das = das
+        self.arr = arr
+        self.reset()
+
+    def reset(self):
+        """Forget held keys and queued input (for a new game)"""
+        self.pending = deque()  # (time, pressed, action) in arrival order
+        self.shifts = []  # Sideways actions held, most recent last
+        self.next_repeat = None  # When the held shift next repeats
+        self.charged = False  # ARR 0: DAS has charged, so the held shift stays against the wall
+        self.soft_drop = False
+
+    def key_down(self, key, time):
+        """Queue a key press; False if the key is not bound"""
+        action = self.table.get(key)
+        if action is None:
+            return False
+        self.pending.append((time, True, action))
+        return True
+
+    def key_up(self, key, time):
+        """Queue a key release; False if the key is not bound"""
+        action = self.table.get(key)
+        if action is None:
+            return False
+        self.pending.append((time, False, action))
+        return True
+
+    def update(self, until, apply):
+        """Apply queued inputs and auto-shift repeats up to time `until`, in time order
+
+        `apply(action)` performs an action and returns whether it changed
+        the game (an ARR 0 shift repeats until it does not).
+        """
+        pending = self.pending
+        while True:
+            event_time = pending[0][0] if pending else None
+            repeat_time = self.next_repeat
+            if repeat_time is not None and repeat_time <= until and (event_time is None or repeat_time < event_time):
+                self._repeat(apply)
+            elif event_time is not None and event_time <= until:
+                self._handle(*pending.popleft(), apply)
+            else:
+                break
+        if self.charged:
+            self._shift_to_wall(apply)  # Also takes each new piece straight across
+
+    def _repeat(self, apply):
+        if self.arr > 0:
+            apply(self.shifts[-1])
+            self.next_repeat += self.arr
+        else:
+            self.next_repeat = None
+            self.charged = True
+            self._shift_to_wall(apply)
+
+    def _shift_to_wall(self, apply):
+        shift = self.shifts[-1]
+        for _ in range(MAX_SHIFT):
+            if not apply(shift):
+                break
+
+    def _handle(self, time, pressed, action, apply):
+        if action in SHIFTS:
+            held = action in self.shifts
+            if pressed:
+                if held:
+                    return  # OS key repeat: DAS does the repeating
+                self.shifts.append(action)
+                apply(action)
+                self.next_repeat = time + self.das
+                self.charged = False
+            elif held:
+                was_active = self.shifts[-1] == action
+                self.shifts.remove(action)
+                if not self.shifts:
+                    self.next_repeat = None
+                    self.charged = False
+                elif was_active:
+                    self.next_repeat = time + self.das  # The other direction charges from here
+                    self.charged = False
+        elif action == SOFT_DROP_ON:
+            if pressed != self.soft_drop:
+                self.soft_drop = pressed
+                apply(SOFT_DROP_ON if pressed else SOFT_DROP_OFF)
+        elif pressed:
+            apply(action)
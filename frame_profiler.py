@@ -0,0 +1,218 @@
+"""Per-stage frame timing, a live overlay and a session histogram export
+
+The main loop calls start_frame() at the top of each frame, mark(stage)
+after each stage and end_frame() at the bottom; mark() charges the time
+since the previous mark to that stage. The last `capacity` frames are kept
+in ring buffers for the overlay's graph and percentiles, and every frame
+also goes into a log-scale histogram for the whole session, which save()
+writes out as JSON. A frame counts as dropped when it takes longer than 1.5
+frame budgets, that is when it missed its display slot.
+
+When profiling is off the loop holds NULL_PROFILER instead, whose methods
+do nothing, so instrumentation costs one empty call per stage.
+
+Enable at start with TETRIS_PROFILE=1; F3 toggles it while playing.
+"""
+import bisect
+import json
+import os
+import time
+
+import pygame
+
+from render_cache import get_font
+
+PROFILE = os.environ.get("TETRIS_PROFILE", "") not in ("", "0")
+
+# Stages of the main loop, in the order they run
+STAGES = ("events", "logic", "draw", "leaderboard", "overlay", "profiler", "present", "wait")
+# Frames kept for the overlay
+CAPACITY = 600
+# Histogram bucket upper bounds in seconds: 0.01 ms doubling up to ~2.6 s, then overflow
+BUCKET_BOUNDS = tuple(1e-5 * 2 ** i for i in range(19))
+# A frame slower than this many frame budgets missed its slot
+DROPPED_FACTOR = 1.5
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of an unsorted sequence (0 when empty)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class NullProfiler:
+    """Stand-in used while profiling is off: every call is a no-op"""
+
+    enabled = False
+
+    def start_frame(self):
+        pass
+
+    def mark(self, stage):
+        pass
+
+    def end_frame(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+    """Times the stages of each frame into ring buffers and a session histogram"""
+
+    enabled = True
+
+    def __init__(self, target_fps=60, stages=STAGES, capacity=CAPACITY):
+        self.stages = stages
+        self.index_of = {stage: i for i, stage in enumerate(stages)}
+        self.capacity = capacity
+        self.budget = 1 / target_fps
+        # Ring buffers: stage_times[stage index][frame slot], frame_times[frame slot]
+        self.stage_times = [[0.0] * capacity for _ in stages]
+        self.frame_times = [0.0] * capacity
+        self.slot = 0  # Where the next frame is written
+        self.frames = 0  # Frames recorded this session
+        self.dropped = 0
+        self.histograms = [[0] * (len(BUCKET_BOUNDS) + 1) for _ in range(len(stages) + 1)]
+        self.totals = [0.0] * (len(stages) + 1)
+        self.maxima = [0.0] * (len(stages) + 1)
+        self.current = [0.0] * len(stages)
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def start_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, stage):
+        """Charge the time since the last mark to stage"""
+        now = time.perf_counter()
+        self.current[self.index_of[stage]] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        frame_time = time.perf_counter() - self.frame_start
+        slot = self.slot
+        current = self.current
+        for i, elapsed in enumerate(current):
+            self.stage_times[i][slot] = elapsed
+            self._count(i, elapsed)
+            current[i] = 0.0
+        self.frame_times[slot] = frame_time
+        self._count(len(current), frame_time)
+        if frame_time > self.budget * DROPPED_FACTOR:
+            self.dropped += 1
+        self.slot = (slot + 1) % self.capacity
+        self.frames += 1
+
+    def _count(self, i, seconds):
+        self.histograms[i][bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.totals[i] += seconds
+        if seconds > self.maxima[i]:
+            self.maxima[i] = seconds
+
+    def recent_frames(self):
+        """Frame times in the ring buffer, oldest first"""
+        if self.frames < self.capacity:
+            return self.frame_times[:self.frames]
+        return self.frame_times[self.slot:] + self.frame_times[:self.slot]
+
+    def recent(self, stage):
+        """Times of a stage in the ring buffer (in slot order)"""
+        return self.stage_times[self.index_of[stage]][:min(self.frames, self.capacity)]
+
+    def summary(self):
+        """{"frames", "dropped", "budget_ms", "buckets_ms", "stages": {stage or "frame": stats}}"""
+        stats = {}
+        for i, name in enumerate(self.stages + ("frame",)):
+            stats[name] = {
+                "mean_ms": self.totals[i] / max(self.frames, 1) * 1000,
+                "max_ms": self.maxima[i] * 1000,
+                "p50_ms": self._histogram_percentile(i, 50) * 1000,
+                "p99_ms": self._histogram_percentile(i, 99) * 1000,
+                "counts": self.histograms[i],
+            }
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "budget_ms": self.budget * 1000,
+            "buckets_ms": [bound * 1000 for bound in BUCKET_BOUNDS],
+            "stages": stats,
+        }
+
+    def _histogram_percentile(self, i, p):
+        """Upper bound of the histogram bucket holding the p-th percentile (the max if it overflowed)"""
+        rank = self.frames * p / 100
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.histograms[i]):
+            seen += count
+            if seen > rank:
+                return min(bound, self.maxima[i])
+        return self.maxima[i]
+
+    def save(self, path):
+        """Write summary() as JSON to path (creating its directory)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+class ProfilerOverlay:
+    """Opaque panel in the bottom-right corner: frame time graph, per-stage p50/p99, dropped frames
+
+    The panel is rebuilt every `refresh` frames and blitted every frame, so
+    reading it does not cost a text render per frame.
+    """
+
+    WIDTH = 240
+    GRAPH_HEIGHT = 36
+    LINE_HEIGHT = 13
+
+    def __init__(self, profiler, refresh=15):
+        self.profiler = profiler
+        self.refresh = refresh
+        self.panel = None
+        self.built_at = -1
+
+    def draw(self, screen):
+        """Blit the panel onto screen and return its rect"""
+        profiler = self.profiler
+        if self.panel is None or profiler.frames - self.built_at >= self.refresh:
+            self.panel = self._build()
+            self.built_at = profiler.frames
+        width, height = screen.get_size()
+        return screen.blit(self.panel, (width - self.WIDTH - 4, height - self.panel.get_height() - 4))
+
+    def _build(self):
+        profiler = self.profiler
+        font = get_font("Courier New", 12)
+        lines = [f"{'stage':11} {'p50 ms':>8} {'p99 ms':>8}"]
+        for stage in profiler.stages:
+            times = profiler.recent(stage)
+            lines.append(f"{stage:11} {percentile(times, 50) * 1000:8.2f} {percentile(times, 99) * 1000:8.2f}")
+        frames = profiler.recent_frames()
+        lines.append(f"{'frame':11} {percentile(frames, 50) * 1000:8.2f} {percentile(frames, 99) * 1000:8.2f}")
+        lines.append(f"dropped {profiler.dropped} of {profiler.frames} frames")
+
+        height = self.GRAPH_HEIGHT + 8 + self.LINE_HEIGHT * len(lines)
+        panel = pygame.Surface((self.WIDTH, height))
+        panel.fill((16, 16, 16))
+        self._draw_graph(panel, frames)
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, (220, 220, 220)),
+                       (4, self.GRAPH_HEIGHT + 6 + i * self.LINE_HEIGHT))
+        return panel
+
+    def _draw_graph(self, panel, frames):
+        """One bar per recent frame; the line is the frame budget, bars are capped at two budgets"""
+        budget = self.profiler.budget
+        graph_width = self.WIDTH - 8
+        bottom = self.GRAPH_HEIGHT + 2
+        scale = self.GRAPH_HEIGHT / (2 * budget)
+        for x, frame_time in enumerate(frames[-graph_width:]):
+            bar = min(self.GRAPH_HEIGHT, max(1, int(frame_time * scale)))
+            color = (220, 60, 60) if frame_time > budget * DROPPED_FACTOR else (80, 200, 80)
+            pygame.draw.line(panel, color, (4 + x, bottom), (4 + x, bottom - bar))
+        budget_y = bottom - int(budget * scale)
+        pygame.draw.line(panel, (200, 200, 60), (4, budget_y), (4 + graph_width, budget_y))
@@ -0,0 +1,124 @@
+"""Board backend for giant boards: chunked row storage and work proportional to the piece
+
+Board keeps its rows in one list, so removing a line is a delete plus an
+insert at the front, moving every row, and clear_lines scans the whole
+board for full rows. On a board thousands of rows tall that makes every
+placement cost O(height).
+
+ChunkedBoard stores the rows in a RowStore: a list of fixed-size chunks
+(deques), so finding a row is two index lookups and removing one shifts
+rows inside its chunk and moves one row across each chunk boundary above
+it, O(chunk size + number of chunks) instead of O(height). Only the rows
+the last piece touched are checked for full lines; the column tops are
+updated per cleared row as on Board. Collision and placement read and
+write just the piece's four cells, so they cost the same on any board
+size.
+"""
+from collections import deque
+from itertools import chain, islice
+
+from tetris_core import Board
+
+# Rows per chunk: about the square root of the tallest boards we run
+CHUNK_ROWS = 64
+
+
+class RowStore:
+    """Rows of a board, top (y = 0) to bottom, in chunks of `chunk` rows
+
+    Behaves like the list of rows Board.grid is: store[y][x], store[y] = row,
+    slices, iteration, len() and == against a list of rows. The top chunk is padded
+    with empty rows above the board so that every chunk is full and row y
+    lives at a fixed chunk and offset.
+    """
+
+    def __init__(self, width, height, chunk=CHUNK_ROWS):
+        self.width = width
+        self.height = height
+        self.chunk = chunk
+        self.pad = -height % chunk
+        rows = self.pad + height
+        self.chunks = [deque([0] * width for _ in range(chunk)) for _ in range(rows // chunk)]
+
+    def _locate(self, y):
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("row index out of range")
+        return divmod(y + self.pad, self.chunk)
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            start, stop, step = y.indices(self.height)
+            if step != 1:
+                return list(self)[y]
+            return self.rows(start, stop)
+        chunk, offset = self._locate(y)
+        return self.chunks[chunk][offset]
+
+    def __setitem__(self, y, row):
+        chunk, offset = self._locate(y)
+        self.chunks[chunk][offset] = list(row)
+
+    def __len__(self):
+        return self.height
+
+    def __iter__(self):
+        return islice(chain.from_iterable(self.chunks), self.pad, None)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def rows(self, start, stop):
+        """Rows start to stop - 1, without walking the rows above"""
+        start, stop = max(start, 0), min(stop, self.height)
+        if start >= stop:
+            return []
+        first, offset = self._locate(start)
+        return list(islice(chain.from_iterable(islice(self.chunks, first, None)), offset, offset + stop - start))
+
+    def remove(self, y):
+        """Delete row y, moving the rows above it down one and adding an empty row at the top"""
+        chunk, offset = self._locate(y)
+        chunks = self.chunks
+        del chunks[chunk][offset]
+        for i in range(chunk, 0, -1):
+            chunks[i].appendleft(chunks[i - 1].pop())
+        chunks[0].appendleft([0] * self.width)
+
+
+class ChunkedBoard(Board):
+    """Board on a RowStore that only looks at the rows the last piece touched
+
+    Code that writes to `grid` directly must call `sync_heights()` after, as
+    with Board; the next clear_lines() then checks every row once.
+    """
+
+    def __init__(self, width=10, height=20):
+        # Not Board.__init__: it would build the whole grid as a list first
+        self.width = width
+        self.height = height
+        self.grid = RowStore(width, height)
+        self.tops = [height] * width
+        self.touched = set()  # Rows that may have become full; None means check them all
+
+    def sync_heights(self):
+        super().sync_heights()
+        self.touched = None
+
+    def place_piece(self, piece):
+        """Place a piece on the board (freeze it)"""
+        self._place_cells(piece)
+        if self.touched is not None:
+            self.touched.update(piece.y + dy for _, dy in piece.get_shape().cells if piece.y + dy >= 0)
+
+    def clear_lines(self):
+        """Clear completed lines and return number of lines cleared"""
+        rows = range(self.height) if self.touched is None else sorted(self.touched)
+        self.touched = set()
+        # Top to bottom, so removing a row never moves the rows still to check
+        full = [y for y in rows if 0 not in self.grid[y]]
+        for y in full:
+            self.grid.remove(y)
+            self._lower_tops(y)
+        return len(full)
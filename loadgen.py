@@ -0,0 +1,108 @@
+"""Simulate many players submitting scores at once and report leaderboard latency
+
+Each player is a thread that submits scores through the same client code
+the game uses. In "direct" mode every submission is an insert followed by
+a top-5 query; in "service" mode it goes through a shared
+LeaderboardService (cached, coalesced reads). By default a
+mock_postgrest.MockPostgrest is started in-process, so nothing touches
+the real leaderboard.
+
+Usage: python loadgen.py --players 50 --scores 20 --latency 0.02 --failure-rate 0.05
+"""
+import argparse
+import random
+import threading
+import time
+
+import leaderboard
+from mock_postgrest import MockPostgrest
+from tournament import percentile
+
+
+def direct_submit(row):
+    leaderboard.insert_remote_scores([row])
+    return leaderboard.fetch_remote_top(5)
+
+
+def run_load(submit, players=20, scores=10, think=0.0, seed=0):
+    """Run players concurrently; return (latencies of successful submissions, error count, seconds)"""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def player(index):
+        nonlocal errors
+        rng = random.Random(seed + index)
+        for i in range(scores):
+            row = {"name": f"player{index}", "score": rng.randint(0, 5000)}
+            start = time.perf_counter()
+            try:
+                submit(row)
+            except Exception:
+                with lock:
+                    errors += 1
+            else:
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+            if think:
+                time.sleep(rng.uniform(0, 2 * think))
+
+    threads = [threading.Thread(target=player, args=(i,)) for i in range(players)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Leaderboard load generator")
+    parser.add_argument("--players", type=int, default=20, help="concurrent players")
+    parser.add_argument("--scores", type=int, default=10, help="scores submitted per player")
+    parser.add_argument("--think", type=float, default=0.0, help="mean seconds between a player's submissions")
+    parser.add_argument("--mode", choices=("direct", "service"), default="direct")
+    parser.add_argument("--url", help="existing PostgREST server (default: start a local mock)")
+    parser.add_argument("--latency", type=float, default=0.0, help="mock server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="mock server extra random latency")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="mock server failure rate")
+    parser.add_argument("--failure-status", type=int, default=500, help="mock server status for failures")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    mock = None
+    if args.url:
+        leaderboard.SUPABASE_URL = args.url
+    else:
+        mock = MockPostgrest(latency=args.latency, jitter=args.jitter,
+                             failure_rate=args.failure_rate, failure_status=args.failure_status,
+                             seed=args.seed).start()
+        leaderboard.SUPABASE_URL = mock.url
+
+    leaderboard.get_client()  # Create the client up front so its import isn't timed
+
+    if args.mode == "service":
+        service = leaderboard.LeaderboardService()
+
+        def submit(row):
+            service.submit([row])
+            return service.top(5)
+    else:
+        submit = direct_submit
+
+    latencies, errors, elapsed = run_load(submit, args.players, args.scores, args.think, args.seed)
+    latencies.sort()
+    total = len(latencies) + errors
+    print(f"{total} submissions by {args.players} players in {elapsed:.2f}s "
+          f"({total / elapsed:.1f}/sec), {errors} failed")
+    if latencies:
+        print(f"latency ms: p50 {percentile(latencies, 50) * 1000:.1f}, "
+              f"p90 {percentile(latencies, 90) * 1000:.1f}, p99 {percentile(latencies, 99) * 1000:.1f}, "
+              f"max {latencies[-1] * 1000:.1f}")
+    if mock is not None:
+        print(f"server handled {mock.requests} requests ({mock.requests / max(total, 1):.2f} per submission)")
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Local stand-in for the Supabase REST API, for testing the leaderboard offline
+
+Implements the part of PostgREST that leaderboard.py uses: selecting
+columns with order and limit, and inserting one row or a batch, on any
+table under /rest/v1/. Rows live in memory. Every request can be slowed
+down by `latency` (plus up to `jitter`) seconds and fails with
+probability `failure_rate`. Failures answer HTTP 500 by default; use
+failure_status=503 to also exercise the client's own retries (newer
+postgrest clients retry GETs that return 503 or 520).
+
+Usage: python mock_postgrest.py --port 54321 --latency 0.05 --failure-rate 0.1
+       TETRIS_SUPABASE_URL=http://127.0.0.1:54321 uv run Tetris.py
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+REST_PREFIX = "/rest/v1/"
+
+
+def select_rows(rows, query):
+    """Apply PostgREST select/order/limit/offset query parameters to a list of rows"""
+    for order in reversed(query.get("order", [""])[0].split(",")):
+        if not order:
+            continue
+        column, _, direction = order.partition(".")
+        descending = direction.startswith("desc")
+        rows = sorted(rows, key=lambda row: (row.get(column) is None, row.get(column)), reverse=descending)
+
+    offset = int(query.get("offset", ["0"])[0])
+    limit = query.get("limit")
+    rows = rows[offset:offset + int(limit[0])] if limit else rows[offset:]
+
+    columns = query.get("select", ["*"])[0]
+    if columns != "*":
+        names = [name.strip() for name in columns.split(",")]
+        rows = [{name: row.get(name) for name in names} for row in rows]
+    return rows
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections from many concurrent clients
+    request_queue_size = 256
+
+
+class MockPostgrest:
+    """In-memory PostgREST server running on a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, failure_rate=0.0,
+                 failure_status=500, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.rng = random.Random(seed)
+        self.tables = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.server = _Server((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="mock-postgrest", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def rows(self, table):
+        with self.lock:
+            return list(self.tables.get(table, []))
+
+    def insert(self, table, rows):
+        """Store rows with an id and created_at like the real table, returning the stored rows"""
+        with self.lock:
+            stored = self.tables.setdefault(table, [])
+            created_at = datetime.now(timezone.utc).isoformat()
+            new_rows = [dict(row, id=len(stored) + i + 1, created_at=created_at) for i, row in enumerate(rows)]
+            stored.extend(new_rows)
+        return new_rows
+
+    def _delay_or_fail(self):
+        """Apply the configured latency; True if this request should fail"""
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + self.rng.uniform(0, self.jitter)
+            fail = self.rng.random() < self.failure_rate
+            if fail:
+                self.failures += 1
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; don't let Nagle hold the body back
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body=None):
+                data = b"" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                if body is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _table(self):
+                url = urlsplit(self.path)
+                if not url.path.startswith(REST_PREFIX):
+                    self._send(404, {"message": f"Unknown path {url.path}"})
+                    return None, None
+                return url.path[len(REST_PREFIX):], parse_qs(url.query)
+
+            def _fail(self):
+                if mock._delay_or_fail():
+                    self._send(mock.failure_status, {"code": "PGRST000", "message": "Injected failure", "details": None,
+                                     "hint": None})
+                    return True
+                return False
+
+            def do_GET(self):
+                table, query = self._table()
+                if table is None or self._fail():
+                    return
+                self._send(200, select_rows(mock.rows(table), query))
+
+            def do_HEAD(self):
+                self.do_GET()
+
+            def do_POST(self):
+                table, query = self._table()
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                if table is None or self._fail():
+                    return
+                try:
+                    payload = json.loads(body or b"null")
+                except ValueError:
+                    self._send(400, {"code": "PGRST102", "message": "Invalid JSON body"})
+                    return
+                rows = payload if isinstance(payload, list) else [payload]
+                if not all(isinstance(row, dict) for row in rows):
+                    self._send(400, {"code": "PGRST102", "message": "Rows must be JSON objects"})
+                    return
+                new_rows = mock.insert(table, rows)
+                if "return=representation" in self.headers.get("Prefer", ""):
+                    self._send(201, select_rows(new_rows, query))
+                else:
+                    self._send(201)
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local PostgREST stand-in for the leaderboard")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra random seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--failure-status", type=int, default=500, help="HTTP status of failed requests")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    mock = MockPostgrest(args.host, args.port, args.latency, args.jitter, args.failure_rate,
+                         args.failure_status, args.seed)
+    print(f"Serving PostgREST stand-in on {mock.url} (Ctrl+C to stop)")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""Enumerate every reachable final placement of a piece for bots and move search
+
+Placements are found from the column height profile of the board and the
+precomputed column bottoms of each rotation, so no Piece.move/collides
+calls are needed. A placement is reachable when the piece can rotate in
+place and then slide to its column at its current row, which is exactly
+what `simulate.play_placement` does before hard dropping.
+"""
+from tetris_core import PIECE_SHAPES, get_row_masks
+
+# Weights for evaluate(): a lightly tuned linear heuristic
+WEIGHTS = {
+    "aggregate_height": -0.51,
+    "lines": 0.76,
+    "holes": -0.36,
+    "bumpiness": -0.18,
+}
+
+
+class BoardState:
+    """Search snapshot of a board: row bitmasks, column heights and hole count"""
+
+    __slots__ = ("width", "height", "rows", "heights", "holes")
+
+    def __init__(self, width, height, rows, heights=None, holes=None):
+        self.width = width
+        self.height = height
+        self.rows = rows
+        if heights is None:
+            heights, holes = _scan_columns(rows, width, height)
+        self.heights = heights
+        self.holes = holes
+
+    @classmethod
+    def from_board(cls, board):
+        """Snapshot a Board (or BitBoard) without modifying it"""
+        rows = getattr(board, "rows", None)
+        if rows is None:
+            top = min(board.tops)  # The rows above the highest column are empty
+            rows = [0] * top + [sum(1 << j for j, cell in enumerate(row) if cell > 0) for row in board.grid[top:]]
+        return cls(board.width, board.height, list(rows))
+
+
+class Placement:
+    """One final position of a piece and the board features it leaves behind"""
+
+    __slots__ = ("rotation", "x", "y", "lines", "holes", "aggregate_height", "bumpiness", "state")
+
+    def __init__(self, rotation, x, y, lines, state):
+        self.rotation = rotation
+        self.x = x
+        self.y = y
+        self.lines = lines
+        self.state = state
+        self.holes = state.holes
+        heights = state.heights
+        self.aggregate_height = sum(heights)
+        bumpiness = 0
+        previous = heights[0]
+        for h in heights:
+            bumpiness += abs(previous - h)
+            previous = h
+        self.bumpiness = bumpiness
+
+    def __repr__(self):
+        return (f"Placement(rotation={self.rotation}, x={self.x}, y={self.y}, lines={self.lines}, "
+                f"holes={self.holes}, aggregate_height={self.aggregate_height}, "
+                f"bumpiness={self.bumpiness})")
+
+
+def _scan_columns(rows, width, height):
+    """Compute column heights and hole count from scratch"""
+    heights = [0] * width
+    holes = 0
+    above = 0  # Columns with a filled cell in the rows seen so far
+    for r, row in enumerate(rows):
+        holes += (above & ~row).bit_count()
+        new = row & ~above
+        while new:
+            low = new & -new
+            heights[low.bit_length() - 1] = height - r
+            new ^= low
+        above |= row
+    return heights, holes
+
+
+def _fits(shape, x, y, state):
+    """Check a rotation fits at (x, y) using only the walls and column heights"""
+    if x + shape.left < 0 or x + shape.right >= state.width:
+        return False
+    top = state.height - y
+    heights = state.heights
+    for dx, bottom in shape.column_bottoms:
+        if bottom >= top - heights[x + dx]:
+            return False
+    return True
+
+
+def _clear_rows(rows, heights, holes, cleared):
+    """Lower `heights` in place for removing the full rows `cleared` (top to bottom) and return the holes left
+
+    A column whose top is above the cleared rows just drops by their number.
+    One whose top cell is cleared ends at the next filled cell below, and the
+    gaps above that cell stop being holes.
+    """
+    height = len(rows)
+    topmost = cleared[0]
+    for c, h in enumerate(heights):
+        if height - h < topmost:
+            heights[c] = h - len(cleared)
+            continue
+        bit = 1 << c
+        heights[c] = 0
+        for r in range(topmost + 1, height):
+            if r in cleared:
+                continue
+            if rows[r] & bit:
+                heights[c] = height - r - sum(1 for below in cleared if below > r)
+                break
+            holes -= 1
+    return holes
+
+
+def _place(state, piece_type, rotation, x):
+    """Drop a piece straight down from above column x and return the Placement"""
+    shape = PIECE_SHAPES[piece_type][rotation]
+    height = state.height
+    heights = state.heights
+
+    # Landing row: the first column whose surface the piece's bottom touches
+    y = min([height - heights[x + dx] - 1 - bottom for dx, bottom in shape.column_bottoms])
+
+    rows = state.rows[:]
+    full_row = (1 << state.width) - 1
+    cleared = []
+    for i, mask in get_row_masks(state.width)[piece_type][rotation][x]:
+        rows[y + i] |= mask
+        if rows[y + i] == full_row:
+            cleared.append(y + i)
+
+    # Only the piece's columns change: new surface and the gaps under it
+    new_heights = heights[:]
+    holes = state.holes
+    for (dx, bottom), (_, top) in zip(shape.column_bottoms, shape.column_tops):
+        c = x + dx
+        holes += height - heights[c] - 1 - (y + bottom)
+        new_heights[c] = height - (y + top)
+    if cleared:
+        holes = _clear_rows(rows, new_heights, holes, cleared)
+        rows = [0] * len(cleared) + [row for row in rows if row != full_row]
+    result = BoardState(state.width, height, rows, new_heights, holes)
+
+    return Placement(rotation, x, y, len(cleared), result)
+
+
+def enumerate_placements(state, piece_type, x=3, y=0):
+    """Every reachable final placement of a piece of piece_type starting at (x, y) in rotation 0"""
+    shapes = PIECE_SHAPES[piece_type]
+    placements = []
+    for rotation, shape in enumerate(shapes):
+        # Rotations happen in place, so a blocked rotation blocks all later ones
+        if not _fits(shape, x, y, state):
+            break
+        placements.append(_place(state, piece_type, rotation, x))
+        for step in (-1, 1):
+            target = x + step
+            while _fits(shape, target, y, state):
+                placements.append(_place(state, piece_type, rotation, target))
+                target += step
+    return placements
+
+
+def game_placements(game, lookahead=False):
+    """Placements for game.current_piece, or (first, second) pairs including game.next_piece"""
+    piece = game.current_piece
+    state = BoardState.from_board(game.board)
+    firsts = enumerate_placements(state, piece.type, piece.x, piece.y)
+    if not lookahead or game.next_piece is None:
+        return firsts
+
+    next_piece = game.next_piece
+    return [
+        (first, second)
+        for first in firsts
+        for second in enumerate_placements(first.state, next_piece.type, next_piece.x, next_piece.y)
+    ]
+
+
+def evaluate(placement, weights=WEIGHTS):
+    """Linear score of the board a placement leaves (higher is better)"""
+    return (weights["aggregate_height"] * placement.aggregate_height
+            + weights["lines"] * placement.lines
+            + weights["holes"] * placement.holes
+            + weights["bumpiness"] * placement.bumpiness)
+
+
+def _drop_profile(shape):
+    """What _best_drop_value needs of a rotation: its column bottoms, its outer columns and
+    their tops, and the bumpiness between its own columns (the same wherever it lands)"""
+    tops = [top for _, top in shape.column_tops]
+    inner = sum(abs(a - b) for a, b in zip(tops, tops[1:]))
+    return shape.column_bottoms, shape.left, shape.right, tops[0], tops[-1], inner
+
+
+# _DROP_PROFILES[type][rotation], see _drop_profile
+_DROP_PROFILES = tuple(tuple(_drop_profile(shape) for shape in shapes) for shapes in PIECE_SHAPES)
+# _FLATTEST[type]: the least bumpiness any rotation has between its own columns
+_FLATTEST = tuple(min(profile[5] for profile in profiles) for profiles in _DROP_PROFILES)
+
+
+def _best_drop_value(state, piece_type, x, y, weights, floor=None):
+    """Best evaluate() value over a piece's placements, without building Placements
+
+    Same result as max(evaluate(p) for p in enumerate_placements(...)), or None
+    when the piece cannot be placed. Only placements that can clear lines build
+    the board they leave; the rest are scored from the column profile alone:
+    the piece adds the gaps under it as holes, raises the aggregate height by
+    its four cells plus those holes, and changes the bumpiness only at its
+    outer edges.
+
+    With a floor, placements that cannot score floor are skipped unscored:
+    the result is still exact when it reaches floor and below it (or None)
+    otherwise.
+    """
+    height = state.height
+    width = state.width
+    heights = state.heights
+    rows = state.rows
+    full_row = (1 << state.width) - 1
+    # bumps[c]: bumpiness of columns 0 to c, so any run of neighbouring pairs is one subtraction
+    bumps = []
+    base_bumpiness = 0
+    previous = heights[0]
+    for h in heights:
+        base_bumpiness += abs(previous - h)
+        bumps.append(base_bumpiness)
+        previous = h
+    base_aggregate = sum(heights) + 4
+    base_holes = state.holes
+    last = width - 1
+    w_height, w_holes, w_bumpiness = weights["aggregate_height"], weights["holes"], weights["bumpiness"]
+
+    # With the stack more than a piece below row y, every rotation and column is reachable
+    tallest = max(heights)
+    open_top = tallest + 4 <= height - y
+
+    # A drop only fills cells above each column's top, so the piece can only complete rows
+    # missing at most four cells with nothing above the gaps; on boards wider than a piece
+    # those are all inside the stack. Their gaps' column spans, and the first such row.
+    clear_spans = []
+    near_full = height
+    above = 0  # Columns filled in the rows checked so far
+    for r in range(height - tallest if width > 4 else 0, height):
+        row = rows[r]
+        if row.bit_count() >= width - 4:
+            gap = full_row ^ row
+            if not gap & above:
+                if not clear_spans:
+                    near_full = r
+                clear_spans.append(((gap & -gap).bit_length() - 1, gap.bit_length() - 1))
+        above |= row
+        if above == full_row:
+            break
+
+    # Without a line clear a placement scores at most as if it added no holes and left flat
+    # edges, so it can only beat a score by covering enough of the bumpiness: `need` more
+    # than the bumpiness between its own columns. Both floor and the best placement so far
+    # set the score to beat.
+    prune = w_height <= 0 and w_holes <= 0 and w_bumpiness < 0
+    if prune:
+        unchanged = w_height * base_aggregate + w_holes * base_holes + w_bumpiness * base_bumpiness
+        need = float("-inf") if floor is None else (floor - 1e-9 - unchanged) / -w_bumpiness
+        if base_bumpiness < need + _FLATTEST[piece_type] and not clear_spans:
+            return None
+        padded = [0, *bumps, base_bumpiness]  # Padded at the walls
+        coverage = {}  # Column span: (bumpiness each target covers, the most any does)
+
+    surface = [height - 1 - h for h in heights]  # Lowest empty row of every column
+    best = None
+    for rotation, shape in enumerate(PIECE_SHAPES[piece_type]):
+        if open_top:
+            if x + shape.left < 0 or x + shape.right >= width:
+                break
+            targets = range(-shape.left, width - shape.right)
+        elif not _fits(shape, x, y, state):
+            break
+        else:
+            targets = [x]
+            for step in (-1, 1):
+                target = x + step
+                while _fits(shape, target, y, state):
+                    targets.append(target)
+                    target += step
+
+        bottoms, left, right, top_left, top_right, inner = _DROP_PROFILES[piece_type][rotation]
+        if prune:
+            span = right - left
+            if span not in coverage:
+                covered = [padded[c + span + 2] - padded[c] for c in range(width - span)]
+                coverage[span] = covered, max(covered)
+            covered, most = coverage[span]
+            # Targets whose columns take in all of a row's gaps might clear it: always scored
+            forced = None
+            for lo, hi in clear_spans:
+                if hi - lo <= span:
+                    if forced is None:
+                        forced = [False] * (width - span)
+                    start = max(hi - span, 0)
+                    forced[start:lo + 1] = [True] * (lo + 1 - start)
+            if most < need + inner and not forced:
+                continue
+
+        cells_below = shape.bottom
+        for target in targets:
+            c0, c1 = target + left, target + right
+            if prune and covered[c0] < need + inner and not (forced and forced[c0]):
+                continue  # The best so far went past it
+            gaps = [surface[target + dx] - bottom for dx, bottom in bottoms]
+            land = min(gaps)
+            if land + cells_below >= near_full and any(
+                    rows[land + i] | mask == full_row
+                    for i, mask in get_row_masks(width)[piece_type][rotation][target]):
+                value = evaluate(_place(state, piece_type, rotation, target), weights)
+            else:
+                added = sum(gaps) - len(gaps) * land
+                bumpiness = base_bumpiness + inner - (bumps[c1] - bumps[c0])
+                if c0 > 0:
+                    bumpiness += abs(heights[c0 - 1] - (height - land - top_left)) - (bumps[c0] - bumps[c0 - 1])
+                if c1 < last:
+                    bumpiness += abs(height - land - top_right - heights[c1 + 1]) - (bumps[c1 + 1] - bumps[c1])
+                value = (w_height * (base_aggregate + added) + w_holes * (base_holes + added)
+                         + w_bumpiness * bumpiness)
+            if best is None or value > best:
+                best = value
+                if prune:
+                    need = max(need, (best - 1e-9 - unchanged) / -w_bumpiness)
+    return best
+
+
+def best_placement(game, lookahead=True, weights=WEIGHTS):
+    """Pick the best placement for game.current_piece, looking one piece ahead by default
+
+    Lookahead scores every placement of game.next_piece after each placement
+    of the current piece. The current piece's placements are tried best first
+    on their own score, so the best pair found so far sets a floor that lets
+    most of the next piece's placements be skipped unscored. Ties go to the
+    first placement in enumeration order either way.
+    """
+    piece = game.current_piece
+    state = BoardState.from_board(game.board)
+    firsts = enumerate_placements(state, piece.type, piece.x, piece.y)
+    next_piece = game.next_piece if lookahead else None
+    if next_piece is None:
+        best, best_value = None, None
+        for first in firsts:
+            value = evaluate(first, weights)
+            if best_value is None or value > best_value:
+                best, best_value = first, value
+        return best
+
+    scores = [evaluate(first, weights) for first in firsts]
+    best, best_value = None, None
+    for i in sorted(range(len(firsts)), key=scores.__getitem__, reverse=True):
+        first = firsts[i]
+        lines = weights["lines"] * first.lines
+        floor = None if best_value is None else best_value - lines
+        second = _best_drop_value(first.state, next_piece.type, next_piece.x, next_piece.y, weights, floor)
+        if second is None:
+            value = float("-inf")  # The next piece would top out
+        else:
+            value = lines + second
+        if best_value is None or value > best_value or (value == best_value and i < best):
+            best, best_value = i, value
+    return None if best is None else firsts[best]
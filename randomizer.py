@@ -0,0 +1,117 @@
+"""Piece randomizers and the lookahead queue of upcoming pieces
+
+A randomizer picks piece types: "uniform" draws each type independently
+(droughts can be arbitrarily long), "bag" deals shuffled bags of every
+type (7-bag), and "history" rerolls types seen among the last four
+pieces (TGM style). PieceQueue generates (type, color) pairs ahead of
+time in batches and keeps them in deques, so peeking at the upcoming
+pieces is an index lookup and builds no Piece objects.
+"""
+from collections import deque
+
+
+class UniformRandomizer:
+    """Every type equally likely every time (the original behaviour)"""
+
+    name = "uniform"
+
+    def __init__(self, piece_count=7):
+        self.piece_count = piece_count
+
+    def next_type(self, rng):
+        return rng.randint(0, self.piece_count - 1)
+
+
+class BagRandomizer:
+    """Deal every type once per shuffled bag, so no type is ever more than 12 pieces away"""
+
+    name = "bag"
+
+    def __init__(self, piece_count=7):
+        self.piece_count = piece_count
+        self.bag = []
+
+    def next_type(self, rng):
+        if not self.bag:
+            self.bag = list(range(self.piece_count))
+            rng.shuffle(self.bag)
+        return self.bag.pop()
+
+
+class HistoryRandomizer:
+    """Reroll up to `tries` times while the type is among the last four (TGM style)
+
+    The history starts as Z, S, Z, S and the first piece is never Z, S or O,
+    so a game never opens with a piece that forces an overhang.
+    """
+
+    name = "history"
+
+    # Piece type indexes in tetris_core.PIECES
+    Z, S, O = 1, 2, 6
+
+    def __init__(self, piece_count=7, tries=4):
+        self.piece_count = piece_count
+        self.tries = tries
+        self.history = deque([self.Z, self.S, self.Z, self.S], maxlen=4)
+        self.first = True
+
+    def next_type(self, rng):
+        if self.first:
+            self.first = False
+            piece = rng.choice([t for t in range(self.piece_count) if t not in (self.Z, self.S, self.O)])
+        else:
+            for _ in range(self.tries):
+                piece = rng.randint(0, self.piece_count - 1)
+                if piece not in self.history:
+                    break
+        self.history.append(piece)
+        return piece
+
+
+RANDOMIZERS = {
+    "uniform": UniformRandomizer,
+    "bag": BagRandomizer,
+    "history": HistoryRandomizer,
+}
+
+
+class PieceQueue:
+    """Upcoming pieces, generated ahead in batches and kept as parallel type/color deques
+
+    At least `size` pieces are always queued. peek(i) and peek_color(i)
+    look at the i-th upcoming piece (0 is the soonest) for i < size.
+    """
+
+    def __init__(self, randomizer, rng, size=5, color_count=8, batch=None):
+        self.randomizer = randomizer
+        self.rng = rng
+        self.size = size
+        self.color_count = color_count
+        self.batch = max(batch or 2 * size, size + 1)
+        self.types = deque()
+        self.colors = deque()
+        self._refill()
+
+    def _refill(self):
+        next_type = self.randomizer.next_type
+        randint = self.rng.randint
+        for _ in range(self.batch):
+            # Type before color, piece by piece: the same draws Piece() used to make
+            self.types.append(next_type(self.rng))
+            self.colors.append(randint(1, self.color_count - 1))
+
+    def pop(self):
+        """Take the soonest piece as (type, color)"""
+        if len(self.types) <= self.size:
+            self._refill()
+        return self.types.popleft(), self.colors.popleft()
+
+    def peek(self, i=0):
+        return self.types[i]
+
+    def peek_color(self, i=0):
+        return self.colors[i]
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,147 @@
+"""Shared caches for drawing: fonts, rendered text surfaces and block sprites
+
+Fonts are created once per (face, size, bold, italic). Rendered text is kept
+in a bounded LRU keyed by (font, text, color), so static labels and values
+that do not change between frames are rasterized only once. Block sprites
+are built once per block size and theme style, and static backgrounds once
+per theme and layout. Returned surfaces are shared; blit them but never
+draw on them.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from tetris_core import COLORS
+
+_fonts = {}
+
+
+def get_font(face, size, bold=False, italic=False):
+    """Get the font for (face, size, bold, italic), creating it on first use"""
+    key = (face, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(face, size, bold, italic)
+    return font
+
+
+class TextCache:
+    """Least recently used cache of rendered text surfaces"""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Get the antialiased surface for text in font and color"""
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, True, color)
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Evict the least recently used
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color):
+    """Render text through the shared cache"""
+    return text_cache.render(font, text, color)
+
+
+# Color key for the transparent inside of ghost outlines (not used by any block color)
+GHOST_KEY = (255, 0, 255)
+
+
+class BlockAtlas:
+    """Pre-rendered block and ghost-outline sprites, one per color index
+
+    Sprites are block_size - 2 square and are blitted one pixel inside each
+    cell, leaving the board color showing as the grid gap.
+    """
+
+    def __init__(self, block_size, bevel=False):
+        self.block_size = block_size
+        self.blocks = [None]
+        self.ghosts = [None]
+        inner = block_size - 2
+        for color in COLORS[1:]:
+            block = pygame.Surface((inner, inner))
+            block.fill(color)
+            if bevel and inner > 4:
+                light = tuple(min(255, c + 70) for c in color)
+                dark = tuple(c // 2 for c in color)
+                pygame.draw.line(block, light, (0, 0), (inner - 1, 0), 2)
+                pygame.draw.line(block, light, (0, 0), (0, inner - 1), 2)
+                pygame.draw.line(block, dark, (0, inner - 1), (inner - 1, inner - 1), 2)
+                pygame.draw.line(block, dark, (inner - 1, 0), (inner - 1, inner - 1), 2)
+
+            ghost = pygame.Surface((inner, inner))
+            ghost.fill(GHOST_KEY)
+            pygame.draw.rect(ghost, color, ghost.get_rect(), 1)
+            ghost.set_colorkey(GHOST_KEY)
+
+            if pygame.display.get_surface() is not None:
+                # Match the display format so blits skip pixel conversion
+                block = block.convert()
+                ghost = ghost.convert()
+            self.blocks.append(block)
+            self.ghosts.append(ghost)
+
+
+_atlases = {}
+
+
+def get_block_atlas(block_size, theme=None):
+    """Get the block atlas for a block size and theme style, building it on first use
+
+    Themes only change the sprites through an optional "bevel" flag, so the
+    atlas is rebuilt only when the block size or that style changes.
+    """
+    bevel = bool(theme and theme.get("bevel"))
+    key = (block_size, bevel)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = BlockAtlas(block_size, bevel)
+    return atlas
+
+
+class LayerCache:
+    """Static surfaces composed once per key (theme, layout, ...) and reused
+
+    Keys should contain everything the layer depends on, so a theme or layout
+    change simply builds a new layer; old ones are evicted oldest first.
+    """
+
+    def __init__(self, max_size=8):
+        self.max_size = max_size
+        self.layers = OrderedDict()
+
+    def get(self, key, build):
+        """Get the layer for key, calling build() to compose it on a miss"""
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = self.layers[key] = build()
+            if len(self.layers) > self.max_size:
+                self.layers.popitem(last=False)
+        else:
+            self.layers.move_to_end(key)
+        return layer
+
+    def clear(self):
+        self.layers.clear()
+
+
+layer_cache = LayerCache()
@@ -0,0 +1,234 @@
+"""Record a game's inputs as a compact binary replay and re-simulate it headlessly
+
+A replay is the game's seed and settings (including the piece randomizer)
+followed by one entry per input:
+the number of logic ticks since the previous input as a varint, then a
+one-byte action. A typical input costs two bytes. The final tick, score
+and a hash of the board are stored at the end, so playback can check that
+re-simulating the inputs gives the same result. That is what makes
+leaderboard scores auditable.
+
+Playback runs the same fixed-timestep gravity as the game
+(timestep.Gravity), just without waiting for real time.
+
+Usage: python replay.py replays/*.trp
+"""
+import argparse
+import hashlib
+import time
+
+from tetris_core import Game, BitBoard, MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+from timestep import Gravity
+from randomizer import RANDOMIZERS
+
+MAGIC = b"TRP"
+VERSION = 2  # Version 1 had no randomizer field (always uniform)
+RANDOMIZER_NAMES = list(RANDOMIZERS)
+
+# Recorded actions: the Game.step actions that come from keys, plus soft drop key state
+SOFT_DROP_ON = 6
+SOFT_DROP_OFF = 7
+END = 0xFF  # Marks the end of the inputs
+
+
+def encode_varint(value, out):
+    """Append an unsigned LEB128 varint to a bytearray"""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, pos):
+    """Read an unsigned LEB128 varint; returns (value, next position)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def board_hash(board):
+    """Short stable hash of the board contents"""
+    return hashlib.blake2b(bytes(cell for row in board.grid for cell in row), digest_size=8).digest()
+
+
+def apply_action(game, action):
+    """Apply a recorded key action and return whether it changed anything
+
+    Soft drop state is handled by the caller, so those actions count as changes.
+    """
+    if action == MOVE_LEFT:
+        return game.move_piece(-1, 0)
+    if action == MOVE_RIGHT:
+        return game.move_piece(1, 0)
+    if action == ROTATE:
+        return game.rotate_piece()
+    if action == HARD_DROP:
+        dropped = game.state == "playing" and game.current_piece is not None
+        game.drop_piece()
+        return dropped
+    return action == SOFT_DROP_ON or action == SOFT_DROP_OFF
+
+
+class Replay:
+    """A recorded game: settings, (tick, action) inputs and the claimed result"""
+
+    def __init__(self, seed, width=10, height=20, logic_rate=60, randomizer="uniform", events=None,
+                 end_tick=0, score=0, board_digest=bytes(8)):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.logic_rate = logic_rate
+        self.randomizer = randomizer
+        self.events = events if events is not None else []
+        self.end_tick = end_tick
+        self.score = score
+        self.board_digest = board_digest
+
+    def to_bytes(self):
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        for value in (self.seed, self.width, self.height, self.logic_rate,
+                      RANDOMIZER_NAMES.index(self.randomizer)):
+            encode_varint(value, out)
+        last_tick = 0
+        for tick, action in self.events:
+            encode_varint(tick - last_tick, out)
+            out.append(action)
+            last_tick = tick
+        encode_varint(self.end_tick - last_tick, out)
+        out.append(END)
+        encode_varint(self.score, out)
+        out += self.board_digest
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:3] != MAGIC or data[3] not in (1, VERSION):
+            raise ValueError("not a Tetris replay (or an unsupported version)")
+        pos = 4
+        header = []
+        for _ in range(4 if data[3] == 1 else 5):
+            value, pos = decode_varint(data, pos)
+            header.append(value)
+        if len(header) == 5:
+            header[4] = RANDOMIZER_NAMES[header[4]]
+        events = []
+        tick = 0
+        while True:
+            delta, pos = decode_varint(data, pos)
+            tick += delta
+            action = data[pos]
+            pos += 1
+            if action == END:
+                break
+            events.append((tick, action))
+        score, pos = decode_varint(data, pos)
+        return cls(*header, events=events, end_tick=tick, score=score, board_digest=bytes(data[pos:pos + 8]))
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Records the inputs of a live game, stamped with the logic tick they happen on
+
+    Call record() for each input before applying it (or apply() to do both)
+    and tick() after each logic tick that ran gravity. Inputs only count
+    while the game is being played; finish() returns the Replay once it is over.
+    apply() leaves out inputs that changed nothing (a move into a wall), which
+    plays back the same and keeps held-key auto-repeat from bloating replays.
+    """
+
+    def __init__(self, game, logic_rate=60):
+        self.game = game
+        self.replay = Replay(game.seed, game.board.width, game.board.height, logic_rate,
+                             game.randomizer.name)
+        self.ticks = 0
+        self.finished = False
+
+    def record(self, action):
+        if self.game.state == "playing":
+            self.replay.events.append((self.ticks, action))
+
+    def apply(self, action):
+        """Apply an input, record it if it changed the game, and return whether it did"""
+        playing = self.game.state == "playing"
+        changed = apply_action(self.game, action)
+        if changed and playing:
+            self.replay.events.append((self.ticks, action))
+        return changed
+
+    def tick(self):
+        self.ticks += 1
+
+    def finish(self):
+        self.finished = True
+        replay = self.replay
+        replay.end_tick = self.ticks
+        replay.score = self.game.score
+        replay.board_digest = board_hash(self.game.board)
+        return replay
+
+
+def play_replay(replay, board_cls=BitBoard):
+    """Re-simulate a replay's inputs and gravity headlessly and return the finished Game"""
+    game = Game(replay.width, replay.height, board_cls=board_cls, seed=replay.seed,
+                randomizer=replay.randomizer)
+    gravity = Gravity()
+    dt = 1 / replay.logic_rate
+    soft_drop = False
+    events = replay.events
+    i = 0
+    for tick in range(replay.end_tick + 1):
+        while i < len(events) and events[i][0] == tick:
+            action = events[i][1]
+            if action == SOFT_DROP_ON or action == SOFT_DROP_OFF:
+                soft_drop = action == SOFT_DROP_ON
+            else:
+                apply_action(game, action)
+            i += 1
+        if tick == replay.end_tick or game.state != "playing":
+            break
+        gravity.update(game, dt, soft_drop)
+    return game
+
+
+def verify(replay, board_cls=BitBoard):
+    """Re-simulate a replay; returns (matches the recorded score and board, finished Game)"""
+    game = play_replay(replay, board_cls)
+    ok = game.score == replay.score and board_hash(game.board) == replay.board_digest
+    return ok, game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify Tetris replays by re-simulating them")
+    parser.add_argument("replays", nargs="+", help="replay files")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        ok, game = verify(replay)
+        elapsed = time.perf_counter() - start
+        game_seconds = replay.end_tick / replay.logic_rate
+        print(f"{path}: {'OK' if ok else 'MISMATCH'} score {game.score} (claimed {replay.score}), "
+              f"{len(replay.events)} inputs, {game_seconds:.0f}s of play re-simulated in "
+              f"{elapsed * 1000:.1f} ms ({game_seconds / max(elapsed, 1e-9):.0f}x real time)")
+        failures += not ok
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
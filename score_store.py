@@ -0,0 +1,153 @@
+"""Local SQLite leaderboard with write-behind sync to the remote table
+
+Every score is written to the local database first, so it is never lost
+to a failed network call, and leaderboard reads are served from a local
+score index. ScoreSync runs on a background thread: it sends unsent
+scores in batches, backing off after failures, and replaces the local
+copy of the remote top scores after each successful round.
+"""
+import random
+import sqlite3
+import threading
+
+# Scores sent per remote insert
+BATCH_SIZE = 50
+# How many of the best remote scores are mirrored locally
+REMOTE_TOP_N = 20
+# Seconds between sync rounds when nothing new is saved
+SYNC_INTERVAL = 60
+# Retry delays after a failed round: doubling from the first up to the max
+BACKOFF_INITIAL = 1
+BACKOFF_MAX = 120
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    synced INTEGER NOT NULL DEFAULT 0  -- 0: only stored here, 1: known to be in the remote table
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS unsent_scores ON scores (id) WHERE synced = 0;
+"""
+
+
+class ScoreStore:
+    """SQLite table of scores: remote top scores plus local ones not yet sent
+
+    Safe to share between threads; every call holds the store's lock.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = str(path)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+
+    def add_score(self, name, score):
+        """Record a new score to be sent later and return its id"""
+        with self.lock, self.db:
+            cursor = self.db.execute("INSERT INTO scores (name, score) VALUES (?, ?)", (name, score))
+            return cursor.lastrowid
+
+    def top(self, limit=5):
+        """Best scores, local and remote, as [{"name", "score"}] like the remote table returns"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT name, score FROM scores ORDER BY score DESC, id LIMIT ?", (limit,)
+            ).fetchall()
+        return [{"name": name, "score": score} for name, score in rows]
+
+    def unsent(self, limit=BATCH_SIZE):
+        """Oldest scores not yet sent, as (id, name, score) rows"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT id, name, score FROM scores WHERE synced = 0 ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+
+    def mark_sent(self, ids):
+        with self.lock, self.db:
+            self.db.executemany("UPDATE scores SET synced = 1 WHERE id = ?", [(i,) for i in ids])
+
+    def replace_remote(self, entries):
+        """Make the remote top scores the only sent scores kept locally"""
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM scores WHERE synced = 1")
+            self.db.executemany("INSERT INTO scores (name, score, synced) VALUES (?, ?, 1)",
+                                [(entry["name"], entry["score"]) for entry in entries])
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class ScoreSync:
+    """Background thread that sends unsent scores and mirrors the remote top scores
+
+    `insert(rows)` must send a list of {"name", "score"} dicts and `fetch(limit)`
+    return the best remote scores; both raise on failure. Sync rounds run
+    every `interval` seconds, right away after wake(), and with exponential
+    backoff (plus jitter) while the remote keeps failing. `version` goes up
+    after every successful round so readers can tell the local copy changed.
+    """
+
+    def __init__(self, store, insert, fetch, interval=SYNC_INTERVAL,
+                 backoff_initial=BACKOFF_INITIAL, backoff_max=BACKOFF_MAX):
+        self.store = store
+        self.insert = insert
+        self.fetch = fetch
+        self.interval = interval
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.backoff = 0
+        self.version = 0
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="score-sync", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def wake(self):
+        """Run a sync round now (unless backing off after a failure)"""
+        self.wake_event.set()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wake_event.set()
+
+    def sync_once(self):
+        """Send every unsent score, then refresh the remote top scores; False on failure"""
+        try:
+            while True:
+                rows = self.store.unsent()
+                if not rows:
+                    break
+                self.insert([{"name": name, "score": score} for _, name, score in rows])
+                self.store.mark_sent([row_id for row_id, _, _ in rows])
+                print(f"{len(rows)} score(s) sent to the leaderboard")
+            self.store.replace_remote(self.fetch(REMOTE_TOP_N))
+        except Exception as e:
+            print(f"Error syncing scores: {e}")
+            return False
+        self.version += 1
+        return True
+
+    def next_delay(self, ok):
+        """Seconds to wait after a round that succeeded (ok) or failed"""
+        if ok:
+            self.backoff = 0
+            return self.interval
+        self.backoff = min(self.backoff * 2 or self.backoff_initial, self.backoff_max)
+        return self.backoff * random.uniform(0.8, 1.2)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            ok = self.sync_once()
+            delay = self.next_delay(ok)
+            if ok:
+                self.wake_event.wait(delay)
+            else:
+                self.stop_event.wait(delay)  # New scores must not cut a backoff short
+            self.wake_event.clear()
@@ -0,0 +1,118 @@
+"""Sound effects on reserved mixer channels, with per-effect voice and rate limits
+
+Sound.play() takes whatever channel is free, so rapid effects (hard drops
+in quick succession) grab a new channel every time and, once all are busy,
+cut off arbitrary other sounds. SoundEffects instead reserves a small pool
+of channels per effect category, so effects never compete with the
+rest of the mixer or with other categories. Each effect also has:
+
+- a voice limit: at most that many copies play at once. One more restarts
+  the oldest copy instead of taking another channel.
+- a minimum interval: plays closer together than that are dropped. Bursts
+  at high event rates then cost nothing and don't turn into noise.
+
+NULL_SFX is the silent sink for headless or accelerated runs. Tetris.Game
+doesn't even install its sound callback when given it.
+"""
+import time
+
+import pygame
+
+# Effect categories and how many mixer channels each reserves
+CATEGORIES = {
+    "piece": 2,
+    "clear": 2,
+}
+
+
+class Effect:
+    """How an effect plays: its channel category, voice limit and minimum seconds between plays"""
+
+    def __init__(self, category, voices=1, min_interval=0.0):
+        self.category = category
+        self.voices = voices
+        self.min_interval = min_interval
+
+
+EFFECTS = {
+    "placed": Effect("piece", voices=2, min_interval=0.03),
+    "line_clear": Effect("clear", voices=1, min_interval=0.08),
+}
+
+
+class Voice:
+    """A reserved channel and what it was last asked to play"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.effect = None
+        self.started = 0.0
+
+
+class NullSfx:
+    """Sound effect sink that plays nothing"""
+
+    def play(self, name):
+        return False
+
+
+NULL_SFX = NullSfx()
+
+
+class SoundEffects:
+    """Plays named effects from `sounds` (anything with get(name), e.g. assets.SoundBank)
+
+    Needs an initialized mixer: the first channels are reserved for the
+    category pools, so Sound.play() elsewhere never takes them. play()
+    returns whether the effect started; a sound that has not loaded yet
+    is skipped.
+    """
+
+    def __init__(self, sounds, effects=EFFECTS, categories=CATEGORIES, clock=time.perf_counter):
+        self.sounds = sounds
+        self.effects = effects
+        self.clock = clock
+        reserved = sum(categories.values())
+        if pygame.mixer.get_num_channels() <= reserved:
+            pygame.mixer.set_num_channels(reserved + 8)  # Keep some free for unpooled sounds
+        pygame.mixer.set_reserved(reserved)
+        self.pools = {}
+        first = 0
+        for category, count in categories.items():
+            self.pools[category] = [Voice(pygame.mixer.Channel(first + i)) for i in range(count)]
+            first += count
+        self.last_played = {}
+        self.played = 0
+        self.rate_limited = 0
+        self.restarted = 0  # Plays that cut off an older voice
+
+    def play(self, name):
+        effect = self.effects.get(name)
+        sound = self.sounds.get(name)
+        if effect is None or sound is None:
+            return False
+
+        now = self.clock()
+        last = self.last_played.get(name)
+        if last is not None and now - last < effect.min_interval:
+            self.rate_limited += 1
+            return False
+
+        voice = self._pick_voice(name, effect)
+        voice.channel.play(sound)
+        voice.effect = name
+        voice.started = now
+        self.last_played[name] = now
+        self.played += 1
+        return True
+
+    def _pick_voice(self, name, effect):
+        """A free channel of the effect's pool, or the voice to cut off: its oldest copy at
+        the voice limit, else the pool's oldest voice"""
+        pool = self.pools[effect.category]
+        busy = [voice for voice in pool if voice.channel.get_busy()]
+        same = [voice for voice in busy if voice.effect == name]
+        if len(same) < effect.voices and len(busy) < len(pool):
+            return next(voice for voice in pool if not voice.channel.get_busy())
+        self.restarted += 1
+        return min(same if len(same) >= effect.voices else busy, key=lambda voice: voice.started)
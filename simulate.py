@@ -0,0 +1,102 @@
+"""Play headless games with a scripted or random policy and report throughput
+
+A policy is called as policy(game, rng) and returns (rotations, column).
+`rng` is the policy's own random.Random, seeded from the game's seed, so
+policies never draw from game.rng: the same seed deals the same pieces
+whichever policy plays them.
+
+Usage: python simulate.py --games 1000 --policy random --seed 1
+"""
+import argparse
+import random
+import time
+
+from tetris_core import Game, Board, BitBoard
+from large_board import ChunkedBoard
+from randomizer import RANDOMIZERS
+from placements import best_placement
+
+
+def random_policy(game, rng):
+    """Pick a random rotation count and target column for the current piece"""
+    return rng.randint(0, 3), rng.randint(-1, game.board.width - 1)
+
+
+def scripted_policy(game, rng):
+    """Lay pieces flat, sweeping the target column across the board"""
+    return 0, (game.pieces_placed * 3) % (game.board.width - 2)
+
+
+def greedy_policy(game, rng):
+    """Take the best placement found with one piece of lookahead"""
+    placement = best_placement(game)
+    if placement is None:
+        return 0, game.current_piece.x
+    return placement.rotation, placement.x
+
+
+POLICIES = {
+    "random": random_policy,
+    "scripted": scripted_policy,
+    "greedy": greedy_policy,
+}
+
+BOARDS = {
+    "list": Board,
+    "bit": BitBoard,
+    "chunked": ChunkedBoard,
+}
+
+
+def play_placement(game, rotations, x):
+    """Rotate, shift towards column x as far as possible, then hard drop"""
+    for _ in range(rotations):
+        game.rotate_piece()
+    piece = game.current_piece
+    step = 1 if x > piece.x else -1
+    while piece.x != x and game.move_piece(step, 0):
+        pass
+    game.drop_piece()
+
+
+def play_game(policy, seed=None, width=10, height=20, board_cls=Board, max_pieces=10000, randomizer="uniform"):
+    """Play one game to the end (or max_pieces) and return the finished Game"""
+    game = Game(width, height, board_cls=board_cls, seed=seed, randomizer=randomizer)
+    rng = random.Random(f"policy-{game.seed}")  # Separate from game.rng, which deals the pieces
+    while game.state == "playing" and game.pieces_placed < max_pieces:
+        rotations, x = policy(game, rng)
+        play_placement(game, rotations, x)
+    return game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Tetris simulation")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--policy", choices=POLICIES, default="random")
+    parser.add_argument("--board", choices=BOARDS, default="bit", help="board backend")
+    parser.add_argument("--randomizer", choices=RANDOMIZERS, default="uniform", help="piece randomizer")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--width", type=int, default=10)
+    parser.add_argument("--height", type=int, default=20)
+    parser.add_argument("--max-pieces", type=int, default=10000, help="stop a game after this many pieces")
+    args = parser.parse_args(argv)
+
+    policy = POLICIES[args.policy]
+    board_cls = BOARDS[args.board]
+    pieces = lines = score = 0
+
+    start = time.perf_counter()
+    for i in range(args.games):
+        game = play_game(policy, args.seed + i, args.width, args.height, board_cls, args.max_pieces,
+                         args.randomizer)
+        pieces += game.pieces_placed
+        lines += game.lines
+        score += game.score
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.games} games, {pieces} pieces, {lines} lines, {score} points in {elapsed:.3f}s")
+    print(f"{args.games / elapsed:.1f} games/sec, {pieces / elapsed:.1f} pieces/sec")
+
+
+if __name__ == "__main__":
+    main()
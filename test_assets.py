@@ -0,0 +1,81 @@
+# test_assets.py
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+
+from assets import ASSETS_DIR, AssetLoader, SoundBank, cache_path, load_sound
+
+
+class TestAssets(unittest.TestCase):
+    """Tests for background sound loading and the decoded sound cache."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.mixer.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.mixer.quit()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = Path(self.tmp.name) / "decoded"
+
+    def test_decoded_sound_is_cached_and_reused(self):
+        source = ASSETS_DIR / "bloop-short.mp3"
+        sound = load_sound(source, self.cache_dir)
+        cached = cache_path(source, self.cache_dir, pygame.mixer.get_init())
+        self.assertEqual(cached.read_bytes(), sound.get_raw())
+
+        with mock.patch("pygame.mixer.Sound", wraps=pygame.mixer.Sound) as sound_cls:
+            again = load_sound(source, self.cache_dir)
+        self.assertNotIn(mock.call(str(source)), sound_cls.call_args_list)  # No decode
+        self.assertEqual(again.get_raw(), sound.get_raw())
+
+    def test_changed_source_replaces_the_stale_cache(self):
+        source = Path(self.tmp.name) / "effect.mp3"
+        source.write_bytes((ASSETS_DIR / "bloop-short.mp3").read_bytes())
+        load_sound(source, self.cache_dir)
+        source.write_bytes((ASSETS_DIR / "debris-break.mp3").read_bytes())
+        load_sound(source, self.cache_dir)
+        self.assertEqual([path.name for path in self.cache_dir.glob("effect-*.pcm")],
+                         [cache_path(source, self.cache_dir, pygame.mixer.get_init()).name])
+
+    def test_loader_fills_the_bank_and_skips_missing_files(self):
+        loader = AssetLoader(cache_dir=self.cache_dir, music_file=None,
+                             sound_files={"placed": "bloop-short.mp3", "gone": "missing.mp3"})
+        self.assertIsNone(loader.sounds.get("placed"))
+        loader.sounds.play("placed")  # Not loaded yet: nothing happens
+        with mock.patch("builtins.print"):
+            loader.start()
+            self.assertTrue(loader.wait(10))
+        self.assertIn("placed", loader.sounds)
+        self.assertNotIn("gone", loader.sounds)
+        loader.sounds.play("gone")
+
+    def test_bank_plays_loaded_sounds(self):
+        sound = mock.Mock()
+        bank = SoundBank({"placed": sound})
+        bank.play("placed")
+        bank.play("line_clear")
+        sound.play.assert_called_once()
+
+    def test_game_plays_through_a_bank_that_is_still_loading(self):
+        from Tetris import Game
+        sound = mock.Mock()
+        bank = SoundBank()
+        game = Game(sounds=bank, seed=1)
+        game.drop_piece()
+        bank.sounds["placed"] = sound
+        game.drop_piece()
+        sound.play.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
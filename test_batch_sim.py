@@ -0,0 +1,48 @@
+# test_batch_sim.py
+import unittest
+import random
+
+import numpy as np
+
+from tetris_core import Game, NOOP, MOVE_LEFT, MOVE_RIGHT, MOVE_DOWN, ROTATE, HARD_DROP
+from batch_sim import BatchGame
+
+
+class TestBatchGame(unittest.TestCase):
+    """The batched engine must match tetris_core.Game step for step."""
+
+    def test_matches_single_games(self):
+        seeds = list(range(64))
+        # A narrow board so random play clears lines now and then
+        batch = BatchGame(seeds, width=6)
+        games = [Game(width=6, rng=random.Random(seed)) for seed in seeds]
+        actions_rng = np.random.default_rng(0)
+        moves = [NOOP, MOVE_LEFT, MOVE_RIGHT, MOVE_DOWN, ROTATE, HARD_DROP]
+
+        for _ in range(600):
+            actions = actions_rng.choice(moves, size=len(seeds), p=[.2, .25, .25, .1, .1, .1])
+            batch.step(actions)
+            for game, action in zip(games, actions):
+                game.step(int(action))
+
+        for b, game in enumerate(games):
+            self.assertEqual(batch.board(b), game.board.grid)
+            self.assertEqual(batch.score[b], game.score)
+            self.assertEqual(batch.pieces_placed[b], game.pieces_placed)
+            self.assertEqual(batch.alive[b], game.state == "playing")
+        self.assertGreater(batch.lines.sum(), 0)
+
+    def test_line_clear_scoring(self):
+        batch = BatchGame([5])
+        batch.grid[0, 18:, :] = 4
+        batch.grid[0, 18:, 5] = 0
+        # Vertical I-piece in column 5 fills the gap in both rows
+        batch.type[0], batch.rotation[0], batch.x[0] = 0, 0, 4
+        batch.step([HARD_DROP])
+        self.assertEqual(batch.lines[0], 2)
+        self.assertEqual(batch.score[0], 4)
+        self.assertEqual(batch.grid[0, 19].tolist(), [0] * 5 + [batch.grid[0, 19, 5]] + [0] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+# test_bench.py
+import unittest
+
+from bench import GROUPS, compare, junk_board, over_budget, run_benchmarks
+from simulate import BOARDS
+
+
+class TestBench(unittest.TestCase):
+    """Tests for the benchmark suite's fixtures and baseline comparison."""
+
+    def test_junk_boards_clear_the_requested_lines(self):
+        for board_cls in BOARDS.values():
+            for lines in range(5):
+                board = junk_board(board_cls, stack=8 - lines, full_lines=lines)
+                self.assertEqual(board.clear_lines(), lines)
+
+    def test_run_benchmarks_filters_and_reports_seconds(self):
+        results = run_benchmarks({"engine": GROUPS["engine"]}, "clear_lines_4", repeat=2, scale=0.01)
+        self.assertEqual(sorted(results), ["micro/clear_lines_4[bit]", "micro/clear_lines_4[chunked]",
+                                           "micro/clear_lines_4[list]"])
+        for result in results.values():
+            self.assertEqual(len(result["samples"]), 2)
+            self.assertEqual(result["best"], min(result["samples"]))
+            self.assertGreater(result["best"], 0)
+
+    def test_compare_flags_slowdowns_past_threshold(self):
+        baseline = {"a": {"best": 1.0}, "b": {"best": 1.0}, "gone": {"best": 1.0}}
+        results = {"a": {"best": 1.2}, "b": {"best": 1.3}, "new": {"best": 5.0}}
+        rows, regressions = compare(results, baseline, threshold=0.25)
+        self.assertEqual([row[0] for row in rows], ["a", "b"])
+        self.assertAlmostEqual(rows[1][3], 0.3)
+        self.assertEqual(regressions, ["b"])
+
+    def test_over_budget_flags_slow_benchmarks(self):
+        results = {"fast": {"best": 0.5e-3}, "slow": {"best": 1.5e-3}, "free": {"best": 9.0}}
+        budgets = {"fast": 1e-3, "slow": 1e-3, "missing": 1e-3}
+        self.assertEqual(over_budget(results, budgets), [("slow", 1.5e-3, 1e-3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
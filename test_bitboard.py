@@ -0,0 +1,142 @@
+# test_bitboard.py
+import unittest
+import random
+from unittest.mock import patch
+
+from tetris_core import Board, BitBoard, Piece, PIECES, PIECE_SHAPES
+
+
+def make_piece(x, y, piece_type, rotation=0, color=1):
+    piece = Piece(x, y)
+    piece.type = piece_type
+    piece.rotation = rotation
+    piece.color = color
+    return piece
+
+
+class TestPieceShapes(unittest.TestCase):
+    """Tests for the precomputed piece geometry table."""
+
+    def test_every_rotation_has_four_cells(self):
+        for piece_type, rotations in enumerate(PIECES):
+            for rotation, blocks in enumerate(rotations):
+                shape = PIECE_SHAPES[piece_type][rotation]
+                self.assertEqual(sorted(dy * 4 + dx for dx, dy in shape.cells), sorted(blocks))
+
+    def test_extents_and_column_bottoms(self):
+        # J, rotation 2: blocks 1, 5, 9, 8
+        shape = PIECE_SHAPES[3][2]
+        self.assertEqual((shape.left, shape.right, shape.top, shape.bottom), (0, 1, 0, 2))
+        self.assertEqual(shape.column_bottoms, ((0, 2), (1, 2)))
+        # T, rotation 0: blocks 1, 4, 5, 6
+        self.assertEqual(PIECE_SHAPES[5][0].column_bottoms, ((0, 1), (1, 1), (2, 1)))
+
+
+class TestBitBoard(unittest.TestCase):
+    """Tests for the bitmask Board backend."""
+
+    def setUp(self):
+        self.board = BitBoard(width=10, height=20)
+
+    def test_walls_and_floor(self):
+        # Vertical I-piece has its blocks in column x+1
+        self.assertFalse(self.board.collides(make_piece(-1, 0, 0)))
+        self.assertTrue(self.board.collides(make_piece(-2, 0, 0)))
+        self.assertFalse(self.board.collides(make_piece(8, 16, 0)))
+        self.assertTrue(self.board.collides(make_piece(9, 0, 0)))
+        self.assertTrue(self.board.collides(make_piece(3, 17, 0)))
+
+    def test_place_and_clear(self):
+        for j in range(10):
+            if j != 5:
+                self.board.grid[19][j] = 3
+        self.board.sync_rows()
+
+        piece = make_piece(4, 0, 0, color=1)
+        piece.drop_to_bottom(self.board)
+        self.assertEqual(piece.y, 16)
+        self.board.place_piece(piece)
+
+        self.assertEqual(self.board.clear_lines(), 1)
+        self.assertEqual(self.board.rows[19], 1 << 5)
+        self.assertEqual(self.board.grid[19][5], 1)
+        self.assertEqual(self.board.rows[0], 0)
+
+    def test_matches_list_board(self):
+        """Random play gives the same collisions and grids as the list Board"""
+        rng = random.Random(7)
+        ref, bits = Board(10, 20), BitBoard(10, 20)
+        for _ in range(200):
+            piece_type = rng.randrange(len(PIECES))
+            rotation = rng.randrange(len(PIECES[piece_type]))
+            piece = make_piece(rng.randint(-3, 9), 0, piece_type, rotation, rng.randint(1, 7))
+            self.assertEqual(ref.collides(piece), bits.collides(piece))
+            if ref.collides(piece):
+                continue
+            piece.drop_to_bottom(ref)
+            ref.place_piece(piece)
+            bits.place_piece(piece)
+            self.assertEqual(ref.clear_lines(), bits.clear_lines())
+            self.assertEqual(ref.grid, bits.grid)
+            if any(cell > 0 for cell in ref.grid[0]):
+                break
+
+
+class TestColumnTops(unittest.TestCase):
+    """Tests for the column height index and drop_distance."""
+
+    def test_drop_distance_matches_scan(self):
+        rng = random.Random(11)
+        for board_cls in (Board, BitBoard):
+            board = board_cls(10, 20)
+            for _ in range(300):
+                piece_type = rng.randrange(len(PIECES))
+                rotation = rng.randrange(len(PIECES[piece_type]))
+                piece = make_piece(rng.randint(-1, 8), rng.randint(0, 17), piece_type, rotation)
+                if board.collides(piece):
+                    continue
+                self.assertEqual(board.drop_distance(piece), board._scan_drop_distance(piece))
+                if rng.random() < 0.5:
+                    piece.y += board.drop_distance(piece)
+                    board.place_piece(piece)
+                    board.clear_lines()
+                    tops = list(board.tops)
+                    board.sync_heights()
+                    self.assertEqual(tops, board.tops)
+                if board.tops[4] < 4:
+                    board = board_cls(10, 20)
+
+    def test_heights_follow_place_and_clear(self):
+        board = BitBoard(10, 20)
+        for j in range(10):
+            if j != 5:
+                board.grid[19][j] = 3
+        board.grid[18][0] = 3
+        board.sync_rows()
+        self.assertEqual(board.heights, [2] + [1] * 4 + [0] + [1] * 4)
+
+        piece = make_piece(4, 0, 0)
+        self.assertEqual(board.drop_distance(piece), 16)
+        piece.drop_to_bottom(board)
+        board.place_piece(piece)
+        board.clear_lines()
+        self.assertEqual(board.heights, [1] + [0] * 4 + [3] + [0] * 4)
+
+    def test_list_board_lowers_tops_without_rescan(self):
+        rng = random.Random(5)
+        board = Board(10, 20)
+        for y in range(8, 20):
+            board.grid[y] = [rng.choice((0, 0, 1, 2)) for _ in range(10)]
+        for y in (9, 14, 15, 19):
+            board.grid[y] = [3] * 10
+        board.sync_heights()
+
+        with patch.object(board, "sync_heights", side_effect=AssertionError("tops rebuilt")):
+            self.assertEqual(board.clear_lines(), 4)
+        tops = list(board.tops)
+        board.sync_heights()
+        self.assertEqual(tops, board.tops)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+# test_controls.py
+import unittest
+
+from tetris_core import Game, Board, MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+from controls import InputEngine, dispatch_table, event_time
+from replay import ReplayRecorder, SOFT_DROP_ON, SOFT_DROP_OFF, apply_action, verify
+from timestep import Gravity
+
+LEFT, RIGHT, UP, DOWN, SPACE = "left", "right", "up", "down", "space"
+KEYBINDS = {"move_left": LEFT, "move_right": RIGHT, "rotate": UP, "move_down": DOWN, "hard_drop": SPACE}
+
+
+class Log:
+    """apply() callback that records (time, action) and always reports a change"""
+
+    def __init__(self):
+        self.actions = []
+
+    def __call__(self, action):
+        self.actions.append(action)
+        return True
+
+
+class TestInputEngine(unittest.TestCase):
+    """Tests for key dispatch, DAS/ARR auto-shift and time-ordered input."""
+
+    def test_dispatch_table_maps_bound_keys(self):
+        self.assertEqual(dispatch_table(KEYBINDS), {LEFT: MOVE_LEFT, RIGHT: MOVE_RIGHT, UP: ROTATE,
+                                                    DOWN: SOFT_DROP_ON, SPACE: HARD_DROP})
+        engine = InputEngine(KEYBINDS)
+        self.assertFalse(engine.key_down("q", 0.0))
+        self.assertTrue(engine.key_down(UP, 0.0))
+
+    def test_event_time_prefers_the_event_timestamp(self):
+        class Event:
+            pass
+        event = Event()
+        self.assertEqual(event_time(event, 1.5), 1.5)
+        event.timestamp = 2500
+        self.assertEqual(event_time(event, 1.5), 2.5)
+
+    def test_inputs_apply_in_time_order_up_to_the_given_time(self):
+        engine = InputEngine(KEYBINDS)
+        log = Log()
+        engine.key_down(UP, 0.010)
+        engine.key_up(UP, 0.020)
+        engine.key_down(SPACE, 0.030)
+        engine.update(0.025, log)
+        self.assertEqual(log.actions, [ROTATE])
+        engine.update(0.030, log)
+        self.assertEqual(log.actions, [ROTATE, HARD_DROP])
+
+    def test_held_shift_repeats_after_das_at_arr(self):
+        engine = InputEngine(KEYBINDS, das=0.15, arr=0.05)
+        log = Log()
+        engine.key_down(LEFT, 1.0)
+        engine.update(1.149, log)
+        self.assertEqual(log.actions, [MOVE_LEFT])  # Only the press until DAS charges
+        engine.update(1.30, log)
+        self.assertEqual(len(log.actions), 5)  # 1.0, then 1.15, 1.20, 1.25 and 1.30
+        engine.key_up(LEFT, 1.32)
+        engine.update(2.0, log)
+        self.assertEqual(len(log.actions), 5)
+
+    def test_repeats_do_not_depend_on_update_rate(self):
+        counts = []
+        for step in (1 / 240, 1 / 60, 1 / 25, 0.5):
+            engine = InputEngine(KEYBINDS, das=0.167, arr=0.033)
+            log = Log()
+            engine.key_down(RIGHT, 0.0)
+            engine.key_up(RIGHT, 1.0)
+            t = 0.0
+            while t < 1.5:
+                t += step
+                engine.update(t, log)
+            counts.append(len(log.actions))
+        self.assertEqual(counts, [counts[0]] * 4)
+        self.assertEqual(counts[0], 1 + 26)  # The press, then repeats at 0.167 + 0.033k up to 1.0
+
+    def test_latest_direction_wins_and_the_other_resumes_after_das(self):
+        engine = InputEngine(KEYBINDS, das=0.1, arr=0.05)
+        log = Log()
+        engine.key_down(LEFT, 0.0)
+        engine.key_down(RIGHT, 0.05)
+        engine.update(0.2, log)
+        self.assertEqual(log.actions, [MOVE_LEFT, MOVE_RIGHT, MOVE_RIGHT, MOVE_RIGHT])  # 0.15, 0.2
+        engine.key_up(RIGHT, 0.2)
+        engine.update(0.29, log)
+        self.assertEqual(log.actions[4:], [])
+        engine.update(0.31, log)
+        self.assertEqual(log.actions[4:], [MOVE_LEFT])
+
+    def test_os_key_repeat_is_ignored(self):
+        engine = InputEngine(KEYBINDS, das=1.0)
+        log = Log()
+        for t in (0.0, 0.03, 0.06):
+            engine.key_down(LEFT, t)
+        engine.update(0.5, log)
+        self.assertEqual(log.actions, [MOVE_LEFT])
+
+    def test_soft_drop_is_held_state(self):
+        engine = InputEngine(KEYBINDS)
+        log = Log()
+        engine.key_down(DOWN, 0.0)
+        engine.update(0.0, log)
+        self.assertTrue(engine.soft_drop)
+        engine.key_down(DOWN, 0.1)
+        engine.key_up(DOWN, 0.2)
+        engine.update(0.2, log)
+        self.assertFalse(engine.soft_drop)
+        self.assertEqual(log.actions, [SOFT_DROP_ON, SOFT_DROP_OFF])
+
+    def test_arr_zero_shifts_to_the_wall_and_keeps_new_pieces_there(self):
+        game = Game(board_cls=Board, seed=4)
+        engine = InputEngine(KEYBINDS, das=0.1, arr=0)
+        apply = lambda action: apply_action(game, action)
+        engine.key_down(LEFT, 0.0)
+        engine.update(0.05, apply)
+        self.assertEqual(game.current_piece.x, 2)
+        engine.update(0.1, apply)
+        self.assertEqual(game.current_piece.x + game.current_piece.get_shape().left, 0)
+        game.drop_piece()
+        engine.update(0.12, apply)
+        self.assertEqual(game.current_piece.x + game.current_piece.get_shape().left, 0)
+
+
+class TestInputReplay(unittest.TestCase):
+    """Input through the engine, ticked like Tetris.main, must replay exactly."""
+
+    def test_engine_driven_game_verifies(self):
+        game = Game(8, 16, board_cls=Board, seed=9)
+        recorder = ReplayRecorder(game)
+        engine = InputEngine(KEYBINDS, das=0.1, arr=0.02)
+        gravity = Gravity()
+        dt = 1 / 60
+        presses = [(0.1, LEFT, 0.6), (0.7, SPACE, 0.72), (0.8, DOWN, 1.5), (1.6, RIGHT, 2.4),
+                   (2.5, UP, 2.55), (2.6, SPACE, 2.65)]
+        for down, key, up in presses:
+            engine.key_down(key, down)
+            engine.key_up(key, up)
+        t = 0.0
+        for _ in range(200):
+            t += dt
+            engine.update(t, recorder.apply)
+            gravity.update(game, dt, engine.soft_drop)
+            recorder.tick()
+            if game.state != "playing":
+                break
+        replay = recorder.finish()
+        self.assertTrue(any(action == MOVE_LEFT for _, action in replay.events))
+        self.assertIn(SOFT_DROP_ON, [action for _, action in replay.events])
+        self.assertTrue(verify(replay)[0])
+
+    def test_moves_into_walls_are_not_recorded(self):
+        game = Game(board_cls=Board, seed=1)
+        recorder = ReplayRecorder(game)
+        for _ in range(10):
+            recorder.apply(MOVE_LEFT)
+        left = len(recorder.replay.events)
+        self.assertLess(left, 10)
+        self.assertFalse(recorder.apply(MOVE_LEFT))
+        self.assertEqual(len(recorder.replay.events), left)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# test_core.py
+import unittest
+import random
+import subprocess
+import sys
+from unittest.mock import Mock
+
+from tetris_core import Game, BitBoard, HARD_DROP, MOVE_LEFT, NOOP
+from simulate import play_game, random_policy, scripted_policy
+
+
+class TestHeadlessCore(unittest.TestCase):
+    """Tests for the pygame-free engine module."""
+
+    def test_no_pygame_or_network_imports(self):
+        code = ("import sys, tetris_core, simulate; "
+                "assert 'pygame' not in sys.modules and 'supabase' not in sys.modules")
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_seeded_games_are_reproducible(self):
+        first = play_game(random_policy, seed=3)
+        second = play_game(random_policy, seed=3)
+        self.assertEqual(first.score, second.score)
+        self.assertEqual(first.pieces_placed, second.pieces_placed)
+        self.assertEqual(first.board.grid, second.board.grid)
+        self.assertEqual(first.state, "gameover")
+
+    def test_policies_get_the_same_pieces_for_a_seed(self):
+        def recording(policy, dealt):
+            def record(game, rng):
+                dealt.append(game.current_piece.type)
+                return policy(game, rng)
+            return record
+
+        for seed in range(3):
+            by_random, by_scripted = [], []
+            play_game(recording(random_policy, by_random), seed=seed)
+            play_game(recording(scripted_policy, by_scripted), seed=seed)
+            dealt = min(len(by_random), len(by_scripted))
+            self.assertGreater(dealt, 5)
+            self.assertEqual(by_random[:dealt], by_scripted[:dealt])
+
+    def test_board_backends_agree(self):
+        for seed in range(5):
+            ref = play_game(scripted_policy, seed=seed)
+            bits = play_game(scripted_policy, seed=seed, board_cls=BitBoard)
+            self.assertEqual(ref.score, bits.score)
+            self.assertEqual(ref.board.grid, bits.board.grid)
+
+    def test_step_and_events(self):
+        on_event = Mock()
+        game = Game(on_event=on_event, rng=random.Random(1))
+        x = game.current_piece.x
+        game.step(MOVE_LEFT)
+        self.assertEqual((game.current_piece.x, game.current_piece.y), (x - 1, 1))
+        game.step(NOOP)
+        self.assertEqual(game.current_piece.y, 2)
+
+        game.step(HARD_DROP)
+        self.assertEqual(game.pieces_placed, 1)
+        on_event.assert_called_once_with("placed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# test_frame_profiler.py
+import json
+import os
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+import frame_profiler
+from frame_profiler import FrameProfiler, ProfilerOverlay, NULL_PROFILER
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests for per-stage frame timing."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(frame_profiler, "time", types.SimpleNamespace(perf_counter=self.clock.perf_counter))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_frame(self, profiler, **stage_seconds):
+        profiler.start_frame()
+        for stage, seconds in stage_seconds.items():
+            self.clock.now += seconds
+            profiler.mark(stage)
+        profiler.end_frame()
+
+    def test_marks_charge_time_to_stages(self):
+        profiler = FrameProfiler(target_fps=60)
+        self.run_frame(profiler, events=0.001, draw=0.004, wait=0.010)
+        self.assertAlmostEqual(profiler.recent("events")[0], 0.001)
+        self.assertAlmostEqual(profiler.recent("draw")[0], 0.004)
+        self.assertAlmostEqual(profiler.recent("logic")[0], 0.0)
+        self.assertAlmostEqual(profiler.recent_frames()[0], 0.015)
+        self.assertEqual(profiler.dropped, 0)
+
+    def test_ring_buffer_keeps_the_latest_frames_in_order(self):
+        profiler = FrameProfiler(capacity=4)
+        for i in range(1, 7):
+            self.run_frame(profiler, draw=i / 1000)
+        self.assertEqual(profiler.frames, 6)
+        self.assertEqual([round(t * 1000) for t in profiler.recent_frames()], [3, 4, 5, 6])
+
+    def test_summary_histogram_covers_the_whole_session(self):
+        profiler = FrameProfiler(target_fps=60, capacity=2)
+        for _ in range(98):
+            self.run_frame(profiler, draw=0.002)
+        self.run_frame(profiler, draw=0.050)
+        self.run_frame(profiler, present=5.0)  # Past the last bucket
+        summary = profiler.summary()
+        self.assertEqual(summary["frames"], 100)
+        self.assertEqual(summary["dropped"], 2)
+        frame = summary["stages"]["frame"]
+        self.assertEqual(sum(frame["counts"]), 100)
+        self.assertEqual(frame["counts"][-1], 1)
+        self.assertLessEqual(frame["p50_ms"], 2.56)
+        self.assertGreater(frame["p50_ms"], 1.28)
+        self.assertAlmostEqual(frame["max_ms"], 5000.0)
+        self.assertAlmostEqual(summary["stages"]["draw"]["mean_ms"], (98 * 2 + 50) / 100)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "profiles" / "session.json"
+            profiler.save(path)
+            self.assertEqual(json.loads(path.read_text())["frames"], 100)
+
+    def test_null_profiler_does_nothing(self):
+        NULL_PROFILER.start_frame()
+        NULL_PROFILER.mark("draw")
+        NULL_PROFILER.end_frame()
+        self.assertFalse(NULL_PROFILER.enabled)
+
+    def test_overlay_draws_in_the_bottom_right_corner(self):
+        pygame.font.init()
+        profiler = FrameProfiler()
+        for _ in range(20):
+            self.run_frame(profiler, draw=0.005, wait=0.011)
+        screen = pygame.Surface((600, 500))
+        rect = ProfilerOverlay(profiler).draw(screen)
+        self.assertTrue(screen.get_rect().contains(rect))
+        self.assertEqual(rect.right, 596)
+        self.assertEqual(rect.bottom, 496)
+
+
+if __name__ == '__main__':
+    unittest.main()
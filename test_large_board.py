@@ -0,0 +1,86 @@
+# test_large_board.py
+import unittest
+
+from tetris_core import Board, Piece
+from large_board import RowStore, ChunkedBoard
+from simulate import random_policy, greedy_policy, play_game
+
+
+def numbered_store(width=3, height=10, chunk=4):
+    """A RowStore whose row y is [y] * width"""
+    store = RowStore(width, height, chunk)
+    for y in range(height):
+        store[y] = [y] * width
+    return store
+
+
+class TestRowStore(unittest.TestCase):
+    """Tests for the chunked row storage."""
+
+    def test_behaves_like_a_list_of_rows(self):
+        store = numbered_store()
+        rows = [[y] * 3 for y in range(10)]
+        self.assertEqual(len(store), 10)
+        self.assertEqual(list(store), rows)
+        self.assertEqual(store, rows)
+        self.assertEqual(store[-1], rows[-1])
+        self.assertEqual(store[2:7], rows[2:7])
+        self.assertEqual(store[8:20], rows[8:20])
+        self.assertEqual(store[::3], rows[::3])
+        with self.assertRaises(IndexError):
+            store[10]
+
+    def test_remove_shifts_rows_above_down(self):
+        store = numbered_store()
+        rows = [[y] * 3 for y in range(10)]
+        for y in (9, 4, 0, 5):
+            store.remove(y)
+            del rows[y]
+            rows.insert(0, [0] * 3)
+            self.assertEqual(store, rows)
+        self.assertTrue(all(len(chunk) == 4 for chunk in store.chunks))
+
+
+class TestChunkedBoard(unittest.TestCase):
+    """ChunkedBoard must play exactly like Board."""
+
+    def assertSameGame(self, policy, seed, width=10, height=20, max_pieces=300):
+        expected = play_game(policy, seed, width, height, Board, max_pieces)
+        game = play_game(policy, seed, width, height, ChunkedBoard, max_pieces)
+        self.assertEqual((game.score, game.lines, game.pieces_placed),
+                         (expected.score, expected.lines, expected.pieces_placed))
+        self.assertEqual(list(game.board.grid), expected.board.grid)
+        self.assertEqual(game.board.tops, expected.board.tops)
+
+    def test_same_games_as_board(self):
+        for seed in range(20):
+            self.assertSameGame(random_policy, seed)
+        self.assertSameGame(greedy_policy, 0, max_pieces=100)
+        self.assertSameGame(greedy_policy, 1, width=12, height=150, max_pieces=100)
+
+    def test_clears_only_full_rows_after_direct_writes(self):
+        board = ChunkedBoard(10, 100)
+        for y in (97, 99):
+            board.grid[y] = [1] * 10
+        board.grid[98] = [1] * 9 + [0]
+        board.sync_heights()
+        self.assertEqual(board.clear_lines(), 2)
+        self.assertEqual(board.grid[99], [1] * 9 + [0])
+        self.assertEqual(board.tops, [99] * 9 + [100])
+
+    def test_clear_checks_rows_the_piece_touched(self):
+        board = ChunkedBoard(4, 300)
+        board.grid[299] = [1, 1, 0, 0]
+        board.sync_heights()
+        board.clear_lines()
+        piece = Piece(1, 0, piece_type=6, color=2)  # O piece fills columns 2 and 3
+        piece.drop_to_bottom(board)
+        board.place_piece(piece)
+        self.assertEqual(board.touched, {298, 299})
+        self.assertEqual(board.clear_lines(), 1)
+        self.assertEqual(board.grid[299], [0, 0, 2, 2])
+        self.assertEqual(board.tops, [300, 300, 299, 299])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# test_leaderboard.py
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from leaderboard import LeaderboardClient, LeaderboardService
+
+ENTRIES = [{"name": "amy", "score": 9}]
+
+
+def wait_for(client, done):
+    """Poll like the game loop until done() or a second passes"""
+    deadline = time.monotonic() + 1
+    while not done() and time.monotonic() < deadline:
+        client.poll()
+        time.sleep(0.005)
+
+
+class TestLeaderboardClient(unittest.TestCase):
+    """Leaderboard requests run in the background and never block the caller."""
+
+    def test_refresh_does_not_block(self):
+        release = threading.Event()
+        client = LeaderboardClient(fetch=lambda: release.wait() and ENTRIES)
+        start = time.monotonic()
+        client.refresh()
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(client.status, "loading")
+        self.assertFalse(client.poll())
+        release.set()
+        wait_for(client, lambda: client.status is None)
+        self.assertEqual(client.data, ENTRIES)
+        client.close()
+
+    def test_queued_refreshes_are_shared(self):
+        release = threading.Event()
+        calls = []
+        client = LeaderboardClient(fetch=lambda: calls.append(1) or release.wait() and ENTRIES)
+        client.refresh()
+        while not calls:
+            time.sleep(0.001)
+        queued = client.refresh()
+        self.assertIs(client.refresh(), queued)
+        release.set()
+        wait_for(client, lambda: client.status is None)
+        self.assertEqual(len(calls), 2)
+        client.close()
+
+    def test_save_then_refresh(self):
+        saved_scores = []
+        results = []
+        client = LeaderboardClient(fetch=lambda: ENTRIES,
+                                   save=lambda name, score: saved_scores.append((name, score)) or True)
+        client.save("amy", 9, results.append)
+        self.assertEqual(client.status, "saving")
+        wait_for(client, lambda: results)
+        self.assertEqual(results, [True])
+        self.assertEqual(saved_scores, [("amy", 9)])
+        self.assertEqual(client.data, ENTRIES)
+        client.close()
+
+    def test_failed_save_keeps_data(self):
+        results = []
+        client = LeaderboardClient(fetch=lambda: ENTRIES, save=lambda name, score: False)
+        client.save("amy", 9, results.append)
+        wait_for(client, lambda: results)
+        self.assertEqual(results, [False])
+        self.assertEqual(client.data, [])
+        client.close()
+
+    def test_slow_request_times_out(self):
+        release = threading.Event()
+        results = []
+        client = LeaderboardClient(fetch=lambda: release.wait() and ENTRIES, timeout=0.05)
+        client.refresh(results.append)
+        queued = client.refresh(results.append)  # Stuck behind the first one on the worker
+        wait_for(client, lambda: len(results) == 2)
+        self.assertEqual(results, [False, False])
+        self.assertTrue(queued.cancelled())
+        self.assertIsNone(client.status)
+        self.assertEqual(client.data, [])
+        release.set()
+        client.close()
+
+    def test_shared_refresh_times_out_once(self):
+        release = threading.Event()
+        self.addCleanup(release.set)  # Free the worker even if poll() raises
+        results = []
+        client = LeaderboardClient(fetch=lambda: release.wait() and ENTRIES, timeout=0.05)
+        client.refresh(results.append)
+        queued = client.refresh(results.append)
+        self.assertIs(client.refresh(results.append), queued)  # Shares the queued fetch
+        time.sleep(0.1)
+        self.assertFalse(client.poll())  # Cancels the shared fetch once, without raising
+        self.assertEqual(results, [False, False, False])
+        self.assertTrue(queued.cancelled())
+        self.assertIsNone(client.status)
+        client.close()
+
+    def test_sync_round_triggers_refresh(self):
+        sync = SimpleNamespace(version=0)
+        entries = []
+        client = LeaderboardClient(fetch=lambda: list(entries), sync=sync)
+        entries.append(ENTRIES[0])
+        sync.version += 1
+        wait_for(client, lambda: client.data)
+        self.assertEqual(client.data, ENTRIES)
+        client.close()
+
+    def test_import_does_not_load_supabase(self):
+        code = "import sys, Tetris; assert 'supabase' not in sys.modules"
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+class TestLeaderboardService(unittest.TestCase):
+    """Remote reads are cached, shared between callers and updated locally."""
+
+    def setUp(self):
+        self.now = 0
+        self.remote = [{"name": "zed", "score": 30}, {"name": "amy", "score": 9}]
+        self.inserted = []
+        self.service = LeaderboardService(fetch=lambda limit: self.remote[:limit],
+                                          insert=self.inserted.extend,
+                                          limit=3, ttl=60, clock=lambda: self.now)
+
+    def test_top_is_cached_until_ttl(self):
+        self.assertEqual(self.service.top(), self.remote)
+        self.remote = []
+        self.now = 59
+        self.assertEqual(len(self.service.top()), 2)
+        self.assertEqual(self.service.fetches, 1)
+        self.now = 60
+        self.assertEqual(self.service.top(), [])
+        self.assertEqual(self.service.fetches, 2)
+
+    def test_submit_updates_ranking_without_fetching(self):
+        self.service.top()
+        self.service.submit([{"name": "bo", "score": 12}, {"name": "cy", "score": 1}])
+        self.assertEqual(len(self.inserted), 2)
+        self.assertEqual([entry["name"] for entry in self.service.top()], ["zed", "bo", "amy"])
+        self.assertEqual(self.service.fetches, 1)
+
+    def test_concurrent_refreshes_share_one_fetch(self):
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch(limit):
+            calls.append(limit)
+            release.wait()
+            return ENTRIES
+
+        service = LeaderboardService(fetch=slow_fetch, insert=None)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.top(5))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        while not calls:
+            time.sleep(0.001)
+        time.sleep(0.02)
+        release.set()
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [ENTRIES] * 8)
+
+    def test_failed_fetch_is_retried(self):
+        def failing_fetch(limit):
+            raise ConnectionError("down")
+        service = LeaderboardService(fetch=failing_fetch, insert=None)
+        with self.assertRaises(ConnectionError):
+            service.top()
+        service.fetch_top = lambda limit: ENTRIES
+        self.assertEqual(service.top(), ENTRIES)
+
+
+if __name__ == '__main__':
+    unittest.main()
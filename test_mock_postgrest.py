@@ -0,0 +1,58 @@
+# test_mock_postgrest.py
+import unittest
+
+import leaderboard
+from loadgen import direct_submit, run_load
+from mock_postgrest import MockPostgrest, select_rows
+
+
+class TestSelectRows(unittest.TestCase):
+    """PostgREST query parameters applied to in-memory rows."""
+
+    def test_select_order_limit(self):
+        rows = [{"id": 1, "name": "amy", "score": 5}, {"id": 2, "name": "bo", "score": 12},
+                {"id": 3, "name": "cy", "score": 7}]
+        query = {"select": ["name,score"], "order": ["score.desc"], "limit": ["2"]}
+        self.assertEqual(select_rows(rows, query), [{"name": "bo", "score": 12}, {"name": "cy", "score": 7}])
+        self.assertEqual(select_rows(rows, {"order": ["score.asc"], "offset": ["2"]}), [rows[1]])
+
+
+class TestMockPostgrest(unittest.TestCase):
+    """The real leaderboard client code against the local stand-in server."""
+
+    def setUp(self):
+        self.mock = MockPostgrest().start()
+        self.url = leaderboard.SUPABASE_URL
+        self.client = leaderboard._client
+        self.offline = leaderboard.OFFLINE
+        leaderboard.SUPABASE_URL = self.mock.url
+        leaderboard._client = None
+        leaderboard.OFFLINE = False  # TETRIS_OFFLINE=1 must not turn the client off here
+
+    def tearDown(self):
+        self.mock.stop()
+        leaderboard.SUPABASE_URL = self.url
+        leaderboard._client = self.client
+        leaderboard.OFFLINE = self.offline
+
+    def test_insert_and_fetch_top(self):
+        leaderboard.insert_remote_scores([{"name": "amy", "score": 5}, {"name": "bo", "score": 12}])
+        leaderboard.insert_remote_scores([{"name": "cy", "score": 7}])
+        self.assertEqual(leaderboard.fetch_remote_top(2), [{"name": "bo", "score": 12}, {"name": "cy", "score": 7}])
+        self.assertEqual(len(self.mock.rows("Leaderboard")), 3)
+
+    def test_injected_failures_raise(self):
+        self.mock.failure_rate = 1.0
+        with self.assertRaises(Exception):
+            leaderboard.fetch_remote_top()
+        self.assertEqual(self.mock.failures, 1)
+
+    def test_load_generator(self):
+        latencies, errors, elapsed = run_load(direct_submit, players=4, scores=3)
+        self.assertEqual((len(latencies), errors), (12, 0))
+        self.assertEqual(len(self.mock.rows("Leaderboard")), 12)
+        self.assertEqual(self.mock.requests, 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
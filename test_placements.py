@@ -0,0 +1,70 @@
+# test_placements.py
+import unittest
+import copy
+import random
+
+from tetris_core import Game, BitBoard, PIECES
+from placements import BoardState, WEIGHTS, enumerate_placements, evaluate, game_placements, best_placement
+from simulate import play_placement
+
+
+class TestPlacements(unittest.TestCase):
+    """Tests for the placement enumerator."""
+
+    def test_empty_board_counts(self):
+        state = BoardState.from_board(BitBoard(10, 20))
+        # O: 9 columns; I: 10 vertical + 7 horizontal
+        self.assertEqual(len(enumerate_placements(state, 6)), 9)
+        self.assertEqual(len(enumerate_placements(state, 0)), 17)
+        for placement in enumerate_placements(state, 6):
+            self.assertEqual((placement.y, placement.holes, placement.aggregate_height), (18, 0, 4))
+            at_wall = placement.x + 1 == 0 or placement.x + 2 == 9
+            self.assertEqual(placement.bumpiness, 2 if at_wall else 4)
+
+    def test_placements_match_real_drops(self):
+        game = Game(board_cls=BitBoard, rng=random.Random(4))
+        for _ in range(30):
+            for placement in game_placements(game):
+                trial = copy.deepcopy(game)
+                play_placement(trial, placement.rotation, placement.x)
+                self.assertEqual(trial.lines - game.lines, placement.lines)
+                self.assertEqual(BoardState.from_board(trial.board).rows, placement.state.rows)
+                self.assertEqual(BoardState.from_board(trial.board).holes, placement.holes)
+            first = best_placement(game)
+            play_placement(game, first.rotation, first.x)
+
+    def test_lookahead_pairs_and_line_clear(self):
+        game = Game(board_cls=BitBoard, rng=random.Random(0))
+        for j in range(10):
+            if j != 5:
+                game.board.grid[19][j] = 2
+        game.board.sync_rows()
+        game.current_piece.type = 0  # Vertical I fills the gap
+
+        pairs = game_placements(game, lookahead=True)
+        self.assertTrue(all(len(pair) == 2 for pair in pairs))
+        best = best_placement(game, lookahead=True)
+        self.assertEqual((best.rotation, best.x, best.lines), (0, 4, 1))
+
+    def test_lookahead_matches_exhaustive_search(self):
+        game = Game(board_cls=BitBoard, rng=random.Random(7))
+        for _ in range(40):
+            best_values = {}
+            for first, second in game_placements(game, lookahead=True):
+                value = WEIGHTS["lines"] * first.lines + evaluate(second)
+                key = (first.rotation, first.x)
+                best_values[key] = max(best_values.get(key, value), value)
+            best = best_placement(game, lookahead=True)
+            self.assertEqual(best_values[(best.rotation, best.x)], max(best_values.values()))
+            play_placement(game, best.rotation, best.x)
+            if game.state != "playing":
+                break
+
+    def test_every_piece_type_has_placements(self):
+        state = BoardState.from_board(BitBoard(10, 20))
+        for piece_type in range(len(PIECES)):
+            self.assertTrue(enumerate_placements(state, piece_type))
+
+
+if __name__ == '__main__':
+    unittest.main()
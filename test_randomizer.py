@@ -0,0 +1,68 @@
+# test_randomizer.py
+import random
+import unittest
+
+from tetris_core import Game
+from randomizer import BagRandomizer, HistoryRandomizer, PieceQueue, UniformRandomizer
+
+
+def sequence(randomizer, count, seed=0):
+    rng = random.Random(seed)
+    return [randomizer.next_type(rng) for _ in range(count)]
+
+
+def longest_drought(types):
+    """Most pieces between two of the same type"""
+    last = {}
+    longest = 0
+    for i, piece in enumerate(types):
+        longest = max(longest, i - last.get(piece, -1) - 1)
+        last[piece] = i
+    return longest
+
+
+class TestRandomizers(unittest.TestCase):
+    """Piece sequences from each randomizer mode."""
+
+    def test_bag_deals_every_type_per_bag(self):
+        types = sequence(BagRandomizer(), 700)
+        for start in range(0, 700, 7):
+            self.assertEqual(sorted(types[start:start + 7]), list(range(7)))
+        self.assertLessEqual(longest_drought(types), 12)
+
+    def test_history_avoids_repeats(self):
+        types = sequence(HistoryRandomizer(), 5000)
+        self.assertNotIn(types[0], (1, 2, 6))
+        repeats = sum(a == b for a, b in zip(types, types[1:]))
+        uniform = sequence(UniformRandomizer(), 5000)
+        self.assertLess(repeats, sum(a == b for a, b in zip(uniform, uniform[1:])) / 4)
+
+    def test_queue_peek_matches_spawns(self):
+        game = Game(seed=4, randomizer="bag", queue_size=5)
+        upcoming = [game.queue.peek(i) for i in range(5)]
+        spawned = []
+        for _ in range(6):
+            game.drop_piece()
+            spawned.append(game.next_piece.type)
+        self.assertEqual(spawned[:5], upcoming)
+        self.assertEqual(len(game.queue), 5)
+
+    def test_queue_refills_in_batches(self):
+        queue = PieceQueue(UniformRandomizer(), random.Random(1), size=3, batch=10)
+        self.assertEqual(len(queue.types), 10)
+        for _ in range(7):
+            queue.pop()
+        self.assertEqual(len(queue.types), 3)
+        queue.pop()
+        self.assertEqual(len(queue.types), 12)
+
+    def test_uniform_queue_matches_piece_draws(self):
+        # Queued uniform pieces use the same random draws as Piece(rng=...) did
+        rng = random.Random(9)
+        expected = [(rng.randint(0, 6), rng.randint(1, 7)) for _ in range(20)]
+        queue = PieceQueue(UniformRandomizer(), random.Random(9), size=5)
+        self.assertEqual([queue.pop() for _ in range(20)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
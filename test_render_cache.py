@@ -0,0 +1,78 @@
+# test_render_cache.py
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from render_cache import TextCache, LayerCache, get_font, get_block_atlas
+from tetris_core import COLORS
+
+
+class TestRenderCache(unittest.TestCase):
+    """Tests for the font registry and rendered text LRU."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def test_font_registry_reuses_fonts(self):
+        self.assertIs(get_font('Calibri', 20, True, False), get_font('Calibri', 20, True, False))
+        self.assertIsNot(get_font('Calibri', 20, True, False), get_font('Calibri', 20, False, False))
+
+    def test_text_cache_hits_and_evicts(self):
+        cache = TextCache(max_size=2)
+        font = get_font('Calibri', 20)
+        first = cache.render(font, "Score: 1", (255, 255, 255))
+        self.assertIs(cache.render(font, "Score: 1", [255, 255, 255]), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.render(font, "Score: 2", (255, 255, 255))
+        cache.render(font, "Score: 1", (255, 255, 255))  # Now most recently used
+        cache.render(font, "Score: 3", (255, 255, 255))  # Evicts "Score: 2"
+        self.assertEqual(len(cache.surfaces), 2)
+        self.assertIs(cache.render(font, "Score: 1", (255, 255, 255)), first)
+        self.assertNotIn((font, "Score: 2", (255, 255, 255)), cache.surfaces)
+
+
+class TestBlockAtlas(unittest.TestCase):
+    """Tests for the pre-rendered block sprites."""
+
+    def test_sprites_match_rect_drawing(self):
+        atlas = get_block_atlas(20)
+        for color_idx in range(1, len(COLORS)):
+            for sprite, width in ((atlas.blocks[color_idx], 0), (atlas.ghosts[color_idx], 1)):
+                drawn = pygame.Surface((20, 20))
+                blitted = pygame.Surface((20, 20))
+                pygame.draw.rect(drawn, COLORS[color_idx], [1, 1, 18, 18], width)
+                blitted.blit(sprite, (1, 1))
+                self.assertEqual(pygame.image.tobytes(drawn, "RGB"), pygame.image.tobytes(blitted, "RGB"))
+
+    def test_atlas_cached_per_size_and_style(self):
+        self.assertIs(get_block_atlas(20, {"board": (0, 0, 0)}), get_block_atlas(20))
+        self.assertIsNot(get_block_atlas(20, {"bevel": True}), get_block_atlas(20))
+        self.assertIsNot(get_block_atlas(24), get_block_atlas(20))
+
+
+class TestLayerCache(unittest.TestCase):
+    """Tests for the static layer cache."""
+
+    def test_builds_once_per_key(self):
+        cache = LayerCache(max_size=2)
+        builds = []
+
+        def build():
+            builds.append(1)
+            return pygame.Surface((4, 4))
+
+        layer = cache.get(("board", "Dark"), build)
+        self.assertIs(cache.get(("board", "Dark"), build), layer)
+        cache.get(("board", "Classic"), build)
+        cache.get(("board", "Starry"), build)  # Evicts "Dark"
+        cache.get(("board", "Dark"), build)
+        self.assertEqual(len(builds), 4)
+        self.assertEqual(len(cache.layers), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# test_renderer.py
+import os
+import random
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from Tetris import Game, GameRenderer, WINDOW_SIZE, draw_game
+
+LAYOUT = (100, 60, 350, 100, 20)
+
+
+class TestGameRenderer(unittest.TestCase):
+    """The dirty-rect renderer must produce the same pixels as a full redraw."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def assertSameFrame(self, game, leaderboard, dirty_screen, renderer, status=None):
+        full_screen = pygame.Surface(WINDOW_SIZE)
+        rects = renderer.draw(game, leaderboard, status)
+        draw_game(full_screen, game, leaderboard, *LAYOUT, leaderboard_status=status)
+        self.assertEqual(pygame.image.tobytes(dirty_screen, "RGB"),
+                         pygame.image.tobytes(full_screen, "RGB"))
+        return rects
+
+    def test_dirty_frames_match_full_redraw(self):
+        random.seed(2)
+        game = Game()
+        leaderboard = [{"name": "amy", "score": 5}]
+        screen = pygame.Surface(WINDOW_SIZE)
+        renderer = GameRenderer(screen, *LAYOUT)
+
+        rects = self.assertSameFrame(game, leaderboard, screen, renderer)
+        self.assertEqual(rects, [screen.get_rect()])
+
+        moves = [lambda: game.move_piece(-1, 0), lambda: game.move_piece(1, 0),
+                 game.rotate_piece, game.tick, game.drop_piece]
+        for step in range(150):
+            random.choice(moves)()
+            if step == 40:
+                game.score += 3
+            if step == 80:
+                leaderboard = leaderboard + [{"name": "bo", "score": 2}]
+            if step == 100:
+                game.set_theme("Classic")
+            rects = self.assertSameFrame(game, leaderboard, screen, renderer)
+            if game.state != "playing":
+                break
+
+    def test_unchanged_frame_has_no_rects(self):
+        game = Game()
+        screen = pygame.Surface(WINDOW_SIZE)
+        renderer = GameRenderer(screen, *LAYOUT)
+        renderer.draw(game, [])
+        self.assertEqual(renderer.draw(game, []), [])
+        game.move_piece(1, 0)
+        rects = renderer.draw(game, [])
+        self.assertTrue(rects)
+        self.assertTrue(all(rect.width == 20 and rect.height == 20 for rect in rects))
+
+    def test_leaderboard_status_change(self):
+        game = Game()
+        leaderboard = [{"name": "amy", "score": 5}]
+        screen = pygame.Surface(WINDOW_SIZE)
+        renderer = GameRenderer(screen, *LAYOUT)
+        self.assertSameFrame(game, leaderboard, screen, renderer, "loading")
+        rects = self.assertSameFrame(game, leaderboard, screen, renderer)
+        self.assertEqual(len(rects), 1)
+        self.assertEqual(rects[0].topleft, (350, 200))
+
+
+if __name__ == '__main__':
+    unittest.main()
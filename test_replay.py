@@ -0,0 +1,106 @@
+# test_replay.py
+import random
+import unittest
+
+from tetris_core import Game, Board, MOVE_LEFT, MOVE_RIGHT, ROTATE, HARD_DROP
+from timestep import Gravity
+from placements import best_placement
+from replay import (Replay, ReplayRecorder, SOFT_DROP_ON, SOFT_DROP_OFF, decode_varint, encode_varint,
+                    play_replay, verify)
+
+NOISE = [MOVE_LEFT, MOVE_RIGHT, ROTATE, SOFT_DROP_ON]
+
+
+def next_input(game, target, soft_drop, rng):
+    """Head for the target placement, with some random key presses mixed in"""
+    piece = game.current_piece
+    if target is None or rng.random() < 0.2:
+        return rng.choice(NOISE)
+    if (piece.rotation, piece.x) != (target.rotation, target.x) and soft_drop:
+        return SOFT_DROP_OFF
+    if piece.rotation != target.rotation:
+        return ROTATE
+    if piece.x != target.x:
+        return MOVE_RIGHT if piece.x < target.x else MOVE_LEFT
+    return rng.choice([HARD_DROP, SOFT_DROP_ON])
+
+
+def record_game(seed, max_ticks=20000, randomizer="uniform"):
+    """Play inputs against fixed-timestep gravity the way Tetris.main does"""
+    rng = random.Random(seed)
+    game = Game(8, 16, board_cls=Board, seed=seed, randomizer=randomizer)
+    recorder = ReplayRecorder(game)
+    gravity = Gravity()
+    soft_drop = False
+    piece = target = None
+    while game.state == "playing" and recorder.ticks < max_ticks:
+        if game.current_piece is not piece:
+            piece = game.current_piece
+            target = best_placement(game, lookahead=False)
+        if rng.random() < 0.1:
+            action = next_input(game, target, soft_drop, rng)
+            if action in (SOFT_DROP_ON, SOFT_DROP_OFF):
+                recorder.record(action)
+                soft_drop = action == SOFT_DROP_ON
+            else:
+                recorder.apply(action)
+        if game.state == "playing":
+            gravity.update(game, 1 / 60, soft_drop)
+            recorder.tick()
+    return game, recorder.finish()
+
+
+class TestReplay(unittest.TestCase):
+    """Replays are compact and re-simulate to the same result."""
+
+    def test_varint_round_trip(self):
+        out = bytearray()
+        values = [0, 1, 127, 128, 300, 2 ** 32 - 1]
+        for value in values:
+            encode_varint(value, out)
+        self.assertEqual(len(out), 1 + 1 + 1 + 2 + 2 + 5)
+        pos = 0
+        for value in values:
+            decoded, pos = decode_varint(out, pos)
+            self.assertEqual(decoded, value)
+
+    def test_same_seed_same_pieces(self):
+        first, second = Game(seed=7), Game(seed=7)
+        for _ in range(20):
+            self.assertEqual((first.current_piece.type, first.current_piece.color),
+                             (second.current_piece.type, second.current_piece.color))
+            first.drop_piece()
+            second.drop_piece()
+
+    def test_playback_matches_recording(self):
+        for seed in range(5):
+            game, replay = record_game(seed)
+            replay = Replay.from_bytes(replay.to_bytes())
+            ok, replayed = verify(replay)
+            self.assertTrue(ok, seed)
+            self.assertEqual(replayed.score, game.score)
+            self.assertEqual(replayed.board.grid, game.board.grid)
+            self.assertEqual(replayed.pieces_placed, game.pieces_placed)
+            # About two bytes per input: a one-byte tick delta and the action
+            self.assertLess(len(replay.to_bytes()), 40 + 3 * len(replay.events))
+
+    def test_randomizer_is_recorded(self):
+        for randomizer in ("bag", "history"):
+            game, replay = record_game(3, randomizer=randomizer)
+            replay = Replay.from_bytes(replay.to_bytes())
+            self.assertEqual(replay.randomizer, randomizer)
+            self.assertTrue(verify(replay)[0])
+
+    def test_tampered_score_fails(self):
+        _, replay = record_game(1)
+        replay.score += 1
+        self.assertFalse(verify(replay)[0])
+
+    def test_playback_stops_at_end_tick(self):
+        game, replay = record_game(1, max_ticks=600)
+        self.assertEqual(game.state, "playing")
+        self.assertEqual(play_replay(replay).board.grid, game.board.grid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# test_score_store.py
+import unittest
+
+from score_store import ScoreStore, ScoreSync
+
+
+class FakeRemote:
+    """Stand-in for the remote Leaderboard table that can be switched off"""
+
+    def __init__(self):
+        self.rows = []
+        self.inserts = []
+        self.up = True
+
+    def insert(self, rows):
+        if not self.up:
+            raise ConnectionError("down")
+        self.inserts.append(rows)
+        self.rows += rows
+
+    def fetch(self, limit):
+        if not self.up:
+            raise ConnectionError("down")
+        return sorted(self.rows, key=lambda row: -row["score"])[:limit]
+
+
+class TestScoreStore(unittest.TestCase):
+    """Scores are kept locally and sent to the remote in the background."""
+
+    def test_top_reads_local_scores(self):
+        store = ScoreStore()
+        for name, score in [("amy", 5), ("bo", 12), ("cy", 7)]:
+            store.add_score(name, score)
+        self.assertEqual(store.top(2), [{"name": "bo", "score": 12}, {"name": "cy", "score": 7}])
+
+    def test_failed_sync_keeps_scores_until_remote_is_back(self):
+        store = ScoreStore()
+        remote = FakeRemote()
+        remote.up = False
+        sync = ScoreSync(store, remote.insert, remote.fetch)
+        store.add_score("amy", 5)
+        store.add_score("bo", 12)
+
+        self.assertFalse(sync.sync_once())
+        self.assertEqual(len(store.unsent()), 2)
+        self.assertEqual(sync.version, 0)
+
+        remote.up = True
+        self.assertTrue(sync.sync_once())
+        self.assertEqual(remote.inserts, [[{"name": "amy", "score": 5}, {"name": "bo", "score": 12}]])
+        self.assertEqual(store.unsent(), [])
+        self.assertEqual(store.top(), [{"name": "bo", "score": 12}, {"name": "amy", "score": 5}])
+        self.assertEqual(sync.version, 1)
+
+    def test_remote_top_replaces_sent_scores(self):
+        store = ScoreStore()
+        remote = FakeRemote()
+        remote.rows = [{"name": "zed", "score": 30}]
+        sync = ScoreSync(store, remote.insert, remote.fetch)
+        store.add_score("amy", 5)
+        sync.sync_once()
+        sync.sync_once()  # Nothing new: the remote copy must not be duplicated
+        self.assertEqual(store.top(), [{"name": "zed", "score": 30}, {"name": "amy", "score": 5}])
+
+        remote.up = False
+        store.add_score("bo", 9)
+        sync.sync_once()
+        self.assertEqual([entry["name"] for entry in store.top()], ["zed", "bo", "amy"])
+
+    def test_backoff_doubles_and_resets(self):
+        sync = ScoreSync(ScoreStore(), None, None, interval=60, backoff_initial=1, backoff_max=4)
+        delays = [sync.next_delay(False) for _ in range(4)]
+        for delay, expected in zip(delays, [1, 2, 4, 4]):
+            self.assertAlmostEqual(delay, expected, delta=expected * 0.2)
+        self.assertEqual(sync.next_delay(True), 60)
+        self.assertAlmostEqual(sync.next_delay(False), 1, delta=0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
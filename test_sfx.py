@@ -0,0 +1,102 @@
+# test_sfx.py
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+
+from assets import SoundBank
+from sfx import Effect, NULL_SFX, SoundEffects
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSoundEffects(unittest.TestCase):
+    """Tests for pooled, voice- and rate-limited sound effect playback."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.mixer.init()
+        # Long enough to keep a channel busy for the whole test
+        cls.long_sound = pygame.mixer.Sound(buffer=bytes(4 * 44100 * 10))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.mixer.quit()
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sounds = SoundBank({"tap": self.long_sound, "thud": self.long_sound, "ding": self.long_sound})
+        effects = {
+            "tap": Effect("small", voices=2, min_interval=0.05),
+            "thud": Effect("small", voices=3),
+            "ding": Effect("big", voices=1),
+        }
+        self.sfx = SoundEffects(self.sounds, effects, {"small": 3, "big": 1}, clock=self.clock)
+        self.addCleanup(pygame.mixer.stop)
+
+    def playing(self, category):
+        return [voice.effect for voice in self.sfx.pools[category] if voice.channel.get_busy()]
+
+    def test_pools_use_reserved_channels(self):
+        self.assertEqual(len(self.sfx.pools["small"]), 3)
+        self.assertEqual(len(self.sfx.pools["big"]), 1)
+        for _ in range(pygame.mixer.get_num_channels()):
+            self.long_sound.play()  # Unpooled plays fill every other channel
+        self.assertEqual(self.playing("small") + self.playing("big"), [])
+
+    def test_rate_limit_drops_plays_that_come_too_soon(self):
+        self.assertTrue(self.sfx.play("tap"))
+        self.clock.now += 0.01
+        self.assertFalse(self.sfx.play("tap"))
+        self.clock.now += 0.05
+        self.assertTrue(self.sfx.play("tap"))
+        self.assertEqual(self.sfx.rate_limited, 1)
+
+    def test_voice_limit_restarts_the_oldest_copy(self):
+        for _ in range(3):
+            self.clock.now += 1
+            self.sfx.play("tap")
+        self.assertEqual(self.playing("small"), ["tap", "tap"])
+        self.assertEqual(self.sfx.restarted, 1)
+        self.assertEqual(sorted(voice.started for voice in self.sfx.pools["small"] if voice.effect),
+                         [102.0, 103.0])
+
+    def test_full_pool_cuts_off_its_oldest_voice(self):
+        self.sfx.play("thud")
+        self.clock.now += 1
+        self.sfx.play("tap")
+        self.clock.now += 1
+        self.sfx.play("thud")
+        self.clock.now += 1
+        self.sfx.play("thud")
+        self.assertEqual(sorted(self.playing("small")), ["tap", "thud", "thud"])
+        self.assertEqual(self.playing("big"), [])  # Other categories are untouched
+        self.sfx.play("ding")
+        self.assertEqual(self.playing("big"), ["ding"])
+
+    def test_unloaded_and_unknown_effects_are_skipped(self):
+        self.sounds.sounds.pop("tap")
+        self.assertFalse(self.sfx.play("tap"))
+        self.assertFalse(self.sfx.play("nope"))
+        self.assertEqual(self.sfx.played, 0)
+
+    def test_silent_game_skips_the_sound_callback(self):
+        from Tetris import Game
+        self.assertIsNone(Game(seed=1).on_event)
+        self.assertIs(Game(seed=1).sounds, NULL_SFX)
+        sounds = mock.Mock()
+        game = Game(sounds=sounds, seed=1)
+        game.drop_piece()
+        sounds.play.assert_called_once_with("placed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# test_timestep.py
+import unittest
+
+from tetris_core import Game
+from timestep import FixedTimestep, Gravity, gravity_interval, MIN_GRAVITY_INTERVAL, SOFT_DROP_INTERVAL
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """Tests for turning frame times into fixed logic ticks."""
+
+    def test_ticks_do_not_depend_on_frame_rate(self):
+        for render_fps in (30, 60, 144, 240):
+            timestep = FixedTimestep(logic_rate=60)
+            ticks = sum(timestep.advance(1 / render_fps) for _ in range(render_fps * 2))
+            self.assertIn(ticks, (119, 120), render_fps)
+
+    def test_catch_up_is_bounded(self):
+        timestep = FixedTimestep(logic_rate=60, max_ticks_per_frame=5)
+        self.assertEqual(timestep.advance(1.0), 5)
+        self.assertAlmostEqual(timestep.dropped_time, 55 / 60)
+        self.assertLess(timestep.accumulator, timestep.dt)
+        self.assertEqual(timestep.advance(0), 0)
+
+    def test_alpha(self):
+        timestep = FixedTimestep(logic_rate=10)
+        self.assertEqual(timestep.advance(0.25), 2)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+
+
+class TestGravity(unittest.TestCase):
+    """Tests for level-based gravity on the logic clock."""
+
+    def test_interval_speeds_up_with_level(self):
+        self.assertGreater(gravity_interval(0), gravity_interval(1))
+        self.assertEqual(gravity_interval(100), MIN_GRAVITY_INTERVAL)
+
+    def test_piece_falls_one_row_per_interval(self):
+        game = Game()
+        gravity = Gravity()
+        start_y = game.current_piece.y
+        ticks = round(gravity_interval(0) * 60)
+        for _ in range(ticks * 3):
+            gravity.update(game, 1 / 60)
+        self.assertEqual(game.current_piece.y, start_y + 3)
+
+    def test_soft_drop_and_level(self):
+        game = Game()
+        gravity = Gravity()
+        self.assertEqual(gravity.interval(game, soft_drop=True), SOFT_DROP_INTERVAL)
+        game.lines = 25
+        self.assertEqual(game.level, 2)
+        self.assertEqual(gravity.interval(game), gravity_interval(2))
+
+    def test_progress(self):
+        game = Game()
+        gravity = Gravity()
+        gravity.update(game, gravity_interval(0) / 2)
+        self.assertAlmostEqual(gravity.progress(game), 0.5)
+        gravity.reset()
+        self.assertEqual(gravity.progress(game), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+# test_tournament.py
+import unittest
+
+from simulate import play_game, scripted_policy
+from tournament import run_tournament, summarize, percentile
+
+
+class TestTournament(unittest.TestCase):
+    """Tests for the process-pool tournament runner."""
+
+    def test_results_match_serial_games(self):
+        seeds = list(range(12))
+        results = list(run_tournament(scripted_policy, seeds, processes=2, chunksize=1))
+        self.assertEqual(sorted(result["seed"] for result in results), seeds)
+        for result in results:
+            game = play_game(scripted_policy, result["seed"])
+            self.assertEqual(result["score"], game.score)
+            self.assertEqual(result["pieces"], game.pieces_placed)
+
+    def test_summarize(self):
+        results = [{"score": score, "lines": score, "pieces": 10} for score in (4, 1, 3, 2)]
+        summary = summarize(results, elapsed=2.0)
+        self.assertEqual(summary["mean_score"], 2.5)
+        self.assertEqual(summary["p50_score"], 2)
+        self.assertEqual(summary["max_score"], 4)
+        self.assertEqual(summary["games_per_sec"], 2.0)
+        self.assertEqual(summary["pieces_per_sec"], 20.0)
+        self.assertEqual(percentile([], 50), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
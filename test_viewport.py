@@ -0,0 +1,115 @@
+# test_viewport.py
+import contextlib
+import io
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from tetris_core import Board, Piece
+from viewport import Viewport
+from large_board import ChunkedBoard
+from Tetris import Game, WINDOW_SIZE, board_layout, board_setup, draw_game, parse_board_size
+
+LAYOUT = (100, 60, 350, 100)
+
+
+class TestViewport(unittest.TestCase):
+    """Tests for the scrolling board window."""
+
+    def test_follows_piece_and_landing_spot(self):
+        board = Board(300, 3000)
+        view = Viewport(25, 50, 300, 3000)
+        piece = Piece(3, 0, piece_type=6, color=1)  # O piece: cells at dx 1-2, dy 0-1
+        view.follow(piece, board)
+        self.assertEqual((view.x, view.y), (0, 0))
+
+        piece.x, piece.y = 150, 1000
+        view.follow(piece, board)
+        self.assertTrue(view.contains(151, 1000) and view.contains(152, 1001))
+        # The floor is 1998 rows down: too far to show both, so the view scrolls just far
+        # enough to keep the piece 3 rows from its bottom edge
+        self.assertEqual(view.y, 1001 + 3 - 49)
+
+        piece.y = 2960
+        view.follow(piece, board)
+        self.assertEqual(view.y, 3000 - 50)  # Clamped to the bottom, landing spot in view
+
+    def test_scrolls_only_when_needed(self):
+        board = Board(300, 3000)
+        view = Viewport(25, 50, 300, 3000)
+        view.x, view.y = 100, 100
+        piece = Piece(110, 120, piece_type=6, color=1)
+        board.tops = [130] * 300  # Lands a few rows below
+        view.follow(piece, board)
+        self.assertEqual((view.x, view.y), (100, 100))
+
+
+class TestBoardLayout(unittest.TestCase):
+    """Tests for sizing the playfield to the board."""
+
+    def test_parse_board_size(self):
+        self.assertEqual(parse_board_size("300x3000"), (300, 3000))
+        self.assertEqual(parse_board_size("10X20"), (10, 20))
+        for text in ("300", "10X", "ax3", "1x2x3", "2x2"):
+            with self.assertRaises(ValueError):
+                parse_board_size(text)
+
+    def test_small_boards_fit_and_big_ones_scroll(self):
+        self.assertEqual(board_layout(10, 20), (20, None))
+        self.assertEqual(board_layout(20, 40), (10, None))
+        block_size, view = board_layout(300, 3000)
+        self.assertEqual(block_size, 8)
+        self.assertEqual((view.width, view.height), (25, 50))
+
+    def test_board_setup(self):
+        self.assertEqual(board_setup("10x20"), (10, 20, 20, None, Board))
+        width, height, block_size, view, board_cls = board_setup("300x3000")
+        self.assertEqual((width, height, block_size, board_cls), (300, 3000, 8, ChunkedBoard))
+        self.assertEqual((view.board_width, view.board_height), (300, 3000))
+
+    def test_malformed_board_size_falls_back_to_default(self):
+        for text in ("300", "10X", "3x3", ""):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(board_setup(text), (10, 20, 20, None, Board))
+            self.assertEqual(len(output.getvalue().splitlines()), 1)
+
+
+class TestViewportDrawing(unittest.TestCase):
+    """Drawing through a viewport shows the same cells, moved to the view's origin."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def frame(self, game, view=None, block_size=20):
+        screen = pygame.Surface(WINDOW_SIZE)
+        draw_game(screen, game, [], *LAYOUT, block_size, view=view)
+        return pygame.image.tobytes(screen, "RGB")
+
+    def test_view_of_whole_board_draws_the_same(self):
+        game = Game(seed=3)
+        for _ in range(8):
+            game.drop_piece()
+        self.assertEqual(self.frame(game, Viewport(10, 20, 10, 20)), self.frame(game))
+
+    def test_scrolled_view_draws_the_visible_cells(self):
+        big = Game(40, 80, seed=3)
+        big.board.grid[79][30] = 2
+        big.board.grid[60][5] = 4  # Outside the view
+        big.board.sync_heights()
+        big.current_piece.x, big.current_piece.y = 27, 63
+        view = Viewport(10, 20, 40, 80)
+        view.x, view.y = 25, 60
+
+        small = Game(seed=3)
+        small.board.grid[19][5] = 2
+        small.board.sync_heights()
+        small.current_piece.x, small.current_piece.y = 2, 3
+        self.assertEqual(self.frame(big, view), self.frame(small))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,467 @@
+"""Headless Tetris engine: pieces, boards and game rules without pygame or network"""
+import random
+
+from randomizer import RANDOMIZERS, PieceQueue
+
+
+# Constants
+COLORS = (
+    (0, 0, 0),        # Black (empty)
+    (0, 240, 240),     # Cyan
+    (240, 240, 0),     # Yellow
+    (128, 0, 128),     # Purple
+    (0, 240, 0),       # Green
+    (240, 0, 0),       # Red
+    (0, 0, 240),       # Blue
+    (255, 127, 0)     # Orange
+)
+
+PIECES = [
+    [[1, 5, 9, 13], [4, 5, 6, 7]],  # I
+    [[4, 5, 9, 10], [2, 6, 5, 9]],  # Z
+    [[6, 7, 9, 10], [1, 5, 6, 10]], # S
+    [[1, 2, 5, 9], [0, 4, 5, 6], [1, 5, 9, 8], [4, 5, 6, 10]], # J
+    [[1, 2, 6, 10], [5, 6, 7, 9], [2, 6, 10, 11], [3, 5, 6, 7]], # L
+    [[1, 4, 5, 6], [1, 4, 5, 9], [4, 5, 6, 9], [1, 5, 6, 9]], # T
+    [[1, 2, 5, 6]]  # O
+]
+
+
+class PieceShape:
+    """Precomputed geometry of one piece rotation (offsets inside the 4x4 box)"""
+
+    __slots__ = ("cells", "left", "right", "top", "bottom", "column_bottoms", "column_tops")
+
+    def __init__(self, blocks):
+        # (dx, dy) offset of each of the 4 cells
+        self.cells = tuple((block % 4, block // 4) for block in blocks)
+        xs = [dx for dx, _ in self.cells]
+        ys = [dy for _, dy in self.cells]
+        # Bounding box / leftmost and rightmost extents
+        self.left, self.right = min(xs), max(xs)
+        self.top, self.bottom = min(ys), max(ys)
+        # Lowest cell in each occupied column as (dx, dy)
+        self.column_bottoms = tuple(
+            (dx, max(dy for cx, dy in self.cells if cx == dx))
+            for dx in range(self.left, self.right + 1)
+        )
+        # Highest cell in each occupied column as (dx, dy)
+        self.column_tops = tuple(
+            (dx, min(dy for cx, dy in self.cells if cx == dx))
+            for dx in range(self.left, self.right + 1)
+        )
+
+
+# Actions accepted by Game.step
+NOOP, MOVE_LEFT, MOVE_RIGHT, MOVE_DOWN, ROTATE, HARD_DROP = range(6)
+
+
+# Geometry table built once at import: PIECE_SHAPES[type][rotation]
+PIECE_SHAPES = tuple(
+    tuple(PieceShape(blocks) for blocks in rotations)
+    for rotations in PIECES
+)
+
+
+class Piece:
+    """Represents a Tetris piece with its position, rotation, and type"""
+    
+    def __init__(self, x=3, y=0, rng=random, piece_type=None, color=None):
+        self.x = x
+        self.y = y
+        self.type = rng.randint(0, len(PIECES) - 1) if piece_type is None else piece_type
+        self.color = rng.randint(1, len(COLORS) - 1) if color is None else color
+        self.rotation = 0
+    
+    def get_blocks(self):
+        """Get the current block positions"""
+        return PIECES[self.type][self.rotation]
+
+    def get_shape(self):
+        """Get the precomputed geometry of the current rotation"""
+        return PIECE_SHAPES[self.type][self.rotation]
+    
+    def move(self, dx, dy, board):
+        """Try to move the piece. Returns True if successful."""
+        old_x, old_y = self.x, self.y
+        self.x += dx
+        self.y += dy
+
+        
+        if board.collides(self):
+            self.x, self.y = old_x, old_y
+            return False
+        return True
+    
+    def rotate(self, board):
+        """Try to rotate the piece. Returns True if successful."""
+        old_rotation = self.rotation
+        self.rotation = (self.rotation + 1) % len(PIECES[self.type])
+        
+        if board.collides(self):
+            self.rotation = old_rotation
+            return False
+        return True
+    
+    def drop_to_bottom(self, board):
+        """Drop the piece to the bottom"""
+        self.y += board.drop_distance(self)
+
+
+class Board:
+    """Represents the game board/playing field
+
+    `tops` is the row of the highest filled cell in each column (height when
+    the column is empty); code that writes to `grid` directly must call
+    `sync_heights()` after.
+    """
+    
+    def __init__(self, width=10, height=20):
+        self.width = width
+        self.height = height
+        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        self.tops = [height] * width
+
+    @property
+    def heights(self):
+        """Height of the stack in each column"""
+        return [self.height - top for top in self.tops]
+
+    def sync_heights(self):
+        """Rebuild the column top index from the grid"""
+        tops = [self.height] * self.width
+        for y in range(self.height - 1, -1, -1):
+            for x, cell in enumerate(self.grid[y]):
+                if cell > 0:
+                    tops[x] = y
+        self.tops = tops
+    
+    def collides(self, piece):
+        """Check if piece collides with board boundaries or placed pieces"""
+        shape = piece.get_shape()
+        x, y = piece.x, piece.y
+
+        # Check boundaries using only the extents
+        if (x + shape.left < 0 or
+            x + shape.right >= self.width or
+            y + shape.bottom >= self.height):
+            return True
+
+        # Check collisions with placed pieces
+        grid = self.grid
+        for dx, dy in shape.cells:
+            if y + dy >= 0 and grid[y + dy][x + dx] > 0:
+                return True
+        return False
+
+    def drop_distance(self, piece):
+        """How many rows the piece can fall before it lands
+
+        Uses the column tops against the bottom of each piece column, so it is
+        constant time unless the piece has slid under an overhang.
+        """
+        tops = self.tops
+        distance = self.height
+        for dx, bottom in piece.get_shape().column_bottoms:
+            row = piece.y + bottom
+            top = tops[piece.x + dx]
+            if row >= top:
+                return self._scan_drop_distance(piece)
+            if top - 1 - row < distance:
+                distance = top - 1 - row
+        return distance
+
+    def _scan_drop_distance(self, piece):
+        """Drop distance by testing each row below the piece"""
+        start_y = piece.y
+        distance = 0
+        piece.y += 1
+        while not self.collides(piece):
+            piece.y += 1
+            distance += 1
+        piece.y = start_y
+        return distance
+    
+    def place_piece(self, piece):
+        """Place a piece on the board (freeze it)"""
+        self._place_cells(piece)
+
+    def _place_cells(self, piece):
+        """Write the piece color into the grid and raise the column tops"""
+        tops = self.tops
+        for dx, dy in piece.get_shape().cells:
+            board_y = dy + piece.y
+            if board_y >= 0:  # Don't place blocks above visible area
+                board_x = dx + piece.x
+                self.grid[board_y][board_x] = piece.color
+                if board_y < tops[board_x]:
+                    tops[board_x] = board_y
+    
+    def clear_lines(self):
+        """Clear completed lines and return number of lines cleared"""
+        lines_cleared = 0
+        
+        # Check from bottom to top
+        row = self.height - 1
+        while row >= 0:
+            if self._is_line_full(row):
+                self._remove_line(row)
+                self._lower_tops(row)
+                lines_cleared += 1
+                # Don't decrement row, check same position again
+            else:
+                row -= 1
+        return lines_cleared
+    
+    def _is_line_full(self, row):
+        """Check if a row is completely filled"""
+        return all(cell > 0 for cell in self.grid[row])
+    
+    def _remove_line(self, row_to_remove):
+        """Remove a line and shift everything down"""
+        del self.grid[row_to_remove]
+        self.grid.insert(0, [0] * self.width)
+
+    def _lower_tops(self, removed):
+        """Update the column tops after row `removed` (which was full) is gone"""
+        tops = self.tops
+        grid = self.grid
+        for x, top in enumerate(tops):
+            if top < removed:
+                tops[x] = top + 1  # The column's top block moved down with the rows above
+            else:
+                # Its top block was in the removed row: find the next block below
+                y = removed + 1
+                while y < self.height and grid[y][x] == 0:
+                    y += 1
+                tops[x] = y
+
+
+# Row masks per board width: _ROW_MASKS[width][type][rotation][x] -> ((row, mask), ...)
+_ROW_MASKS = {}
+
+
+def get_row_masks(width):
+    """Get (building once per width) the row masks for every piece, rotation and x"""
+    if width in _ROW_MASKS:
+        return _ROW_MASKS[width]
+
+    table = []
+    for shapes in PIECE_SHAPES:
+        type_masks = []
+        for shape in shapes:
+            by_x = {}
+            # Only positions fully inside the side walls get an entry
+            for x in range(-shape.left, width - shape.right):
+                masks = [0, 0, 0, 0]
+                for dx, dy in shape.cells:
+                    masks[dy] |= 1 << (x + dx)
+                by_x[x] = tuple((i, mask) for i, mask in enumerate(masks) if mask)
+            type_masks.append(by_x)
+        table.append(type_masks)
+
+    _ROW_MASKS[width] = table
+    return table
+
+
+class BitBoard(Board):
+    """Board backend that stores each row as an integer bitmask (bit j = column j)
+
+    `grid` still holds the colors for drawing, but collision and line checks only
+    use `rows`. Code that writes to `grid` directly must call `sync_rows()` after.
+    """
+
+    def __init__(self, width=10, height=20):
+        super().__init__(width, height)
+        self.full_row = (1 << width) - 1
+        self.masks = get_row_masks(width)
+        self.rows = [0] * height
+
+    def sync_rows(self):
+        """Rebuild the row bitmasks from the color grid"""
+        self.rows = [
+            sum(1 << j for j, cell in enumerate(row) if cell > 0)
+            for row in self.grid
+        ]
+        self.sync_heights()
+
+    def sync_heights(self):
+        """Rebuild the column top index from the row bitmasks"""
+        tops = [self.height] * self.width
+        uncovered = self.full_row  # Columns whose top has not been found yet
+        for y, row in enumerate(self.rows):
+            found = row & uncovered
+            while found:
+                bit = found & -found
+                tops[bit.bit_length() - 1] = y
+                found ^= bit
+            uncovered &= ~row
+            if not uncovered:
+                break
+        self.tops = tops
+
+    def collides(self, piece):
+        """Check if piece collides with board boundaries or placed pieces"""
+        row_masks = self.masks[piece.type][piece.rotation].get(piece.x)
+        if row_masks is None:
+            return True  # Sticks out of the left or right wall
+
+        rows = self.rows
+        for i, mask in row_masks:
+            y = piece.y + i
+            if y >= self.height:
+                return True
+            if y >= 0 and rows[y] & mask:
+                return True
+        return False
+
+    def place_piece(self, piece):
+        """Place a piece on the board (freeze it)"""
+        for i, mask in self.masks[piece.type][piece.rotation][piece.x]:
+            y = piece.y + i
+            if y >= 0:  # Don't place blocks above visible area
+                self.rows[y] |= mask
+        self._place_cells(piece)
+
+    def clear_lines(self):
+        """Clear completed lines and return number of lines cleared"""
+        full = self.full_row
+        if full not in self.rows:
+            return 0
+
+        keep = [i for i, row in enumerate(self.rows) if row != full]
+        lines_cleared = self.height - len(keep)
+        self.rows = [0] * lines_cleared + [self.rows[i] for i in keep]
+        self.grid = ([[0] * self.width for _ in range(lines_cleared)]
+                     + [self.grid[i] for i in keep])
+        self.sync_heights()
+        return lines_cleared
+
+    def _is_line_full(self, row):
+        """Check if a row is completely filled"""
+        return self.rows[row] == self.full_row
+
+    def _remove_line(self, row_to_remove):
+        """Remove a line and shift everything down"""
+        super()._remove_line(row_to_remove)
+        del self.rows[row_to_remove]
+        self.rows.insert(0, 0)
+
+
+class Game:
+    """Game rules and state: spawning, moving, gravity, line clears and score
+
+    `on_event` is called with "placed" and "line_clear" so front ends can
+    play sounds. Pieces come from `rng` (a random.Random) or else from a
+    random.Random owned by the game and seeded with `seed`; the same seed
+    and inputs always give the same game. A random seed is picked when
+    neither is given and kept in `self.seed` so the game can be replayed.
+
+    `randomizer` picks the piece sequence ("uniform", "bag" or "history",
+    see randomizer.py). `queue` holds the `queue_size` pieces after
+    `next_piece`; bots can peek at them without building Pieces.
+    """
+
+    game_over_state = "gameover"
+
+    def __init__(self, width=10, height=20, on_event=None, board_cls=Board, rng=None, seed=None,
+                 randomizer="uniform", queue_size=5):
+        self.board = board_cls(width, height)
+        self.current_piece = None
+        self.next_piece = None
+        self.score = 0
+        self.lines = 0  # Total lines cleared
+        self.pieces_placed = 0
+        self.state = "playing"
+        self.on_event = on_event
+        if rng is None:
+            if seed is None:
+                seed = random.getrandbits(32)
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
+        self.randomizer = RANDOMIZERS[randomizer](len(PIECES))
+        self.queue = PieceQueue(self.randomizer, rng, queue_size, len(COLORS))
+        self.spawn_new_piece()
+
+    @property
+    def level(self):
+        """Level goes up every 10 lines"""
+        return self.lines // 10
+
+    def spawn_new_piece(self):
+        """Create a new piece at the top"""
+        if self.next_piece is None:
+            self.next_piece = self._take_piece()
+
+        self.current_piece = self.next_piece
+        self.next_piece = self._take_piece()
+
+        # Check if game is over (can't place new piece)
+        if self.board.collides(self.current_piece):
+            self.state = self.game_over_state
+
+    def _take_piece(self):
+        piece_type, color = self.queue.pop()
+        return Piece(piece_type=piece_type, color=color)
+
+    def move_piece(self, dx, dy):
+        """Move the current piece"""
+        if self.state == "playing" and self.current_piece:
+            return self.current_piece.move(dx, dy, self.board)
+        return False
+
+    def rotate_piece(self):
+        """Rotate the current piece"""
+        if self.state == "playing" and self.current_piece:
+            return self.current_piece.rotate(self.board)
+        return False
+
+    def drop_piece(self):
+        """Drop current piece to bottom and freeze it"""
+        if self.state == "playing" and self.current_piece:
+            self.current_piece.drop_to_bottom(self.board)
+            self.freeze_current_piece()
+
+    def tick(self):
+        """Game tick - try to move piece down"""
+        if self.state == "playing" and self.current_piece:
+            if not self.current_piece.move(0, 1, self.board):
+                self.freeze_current_piece()
+
+    def step(self, action=NOOP):
+        """Apply one action and then advance the game by one tick"""
+        if action == MOVE_LEFT:
+            self.move_piece(-1, 0)
+        elif action == MOVE_RIGHT:
+            self.move_piece(1, 0)
+        elif action == MOVE_DOWN:
+            self.move_piece(0, 1)
+        elif action == ROTATE:
+            self.rotate_piece()
+        elif action == HARD_DROP:
+            self.drop_piece()
+            return  # The piece is already frozen
+        self.tick()
+
+    def freeze_current_piece(self):
+        """Freeze the current piece and handle line clearing"""
+        if self.current_piece:
+
+            # Notify placed
+            if self.on_event:
+                self.on_event("placed")
+            self.board.place_piece(self.current_piece)
+            self.pieces_placed += 1
+            lines_cleared = self.board.clear_lines()
+
+            # Notify line clear
+            if self.on_event and lines_cleared > 0:
+                self.on_event("line_clear")
+
+            # Update score
+            if lines_cleared > 0:
+                self.lines += lines_cleared
+                self.score += lines_cleared ** 2
+
+            self.spawn_new_piece()
@@ -0,0 +1,76 @@
+"""Fixed-timestep simulation clock and level-based gravity
+
+The game logic advances in fixed ticks of 1 / logic_rate seconds no matter
+how fast frames are rendered. A slow frame is caught up by running several
+ticks, up to a bound, after which the remaining time is dropped so the game
+never spirals trying to catch up.
+"""
+
+# Seconds per row at level 0: the original 25 FPS loop dropped a row every 12 frames
+BASE_GRAVITY_INTERVAL = 0.48
+# Each level falls this much faster than the one before
+GRAVITY_SPEEDUP = 0.85
+# Fastest gravity: one row per 1/60 s
+MIN_GRAVITY_INTERVAL = 1 / 60
+# Soft drop speed: the original loop ticked once per 25 FPS frame
+SOFT_DROP_INTERVAL = 0.04
+
+
+def gravity_interval(level):
+    """Seconds per row for a level"""
+    return max(BASE_GRAVITY_INTERVAL * GRAVITY_SPEEDUP ** level, MIN_GRAVITY_INTERVAL)
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation ticks"""
+
+    def __init__(self, logic_rate=60, max_ticks_per_frame=5):
+        self.dt = 1 / logic_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Time thrown away after too long a frame
+
+    def advance(self, frame_time):
+        """Add a frame's elapsed seconds and return how many ticks to run now"""
+        self.accumulator += frame_time
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks_per_frame:
+            self.dropped_time += (ticks - self.max_ticks_per_frame) * self.dt
+            ticks = self.max_ticks_per_frame
+            self.accumulator %= self.dt
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """How far the render time is between the last tick and the next (0 to 1)"""
+        return self.accumulator / self.dt
+
+
+class Gravity:
+    """Moves the falling piece down at the rate of the game's level"""
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def reset(self):
+        self.elapsed = 0.0
+
+    def interval(self, game, soft_drop=False):
+        interval = gravity_interval(game.level)
+        if soft_drop:
+            interval = min(interval, SOFT_DROP_INTERVAL)
+        return interval
+
+    def update(self, game, dt, soft_drop=False):
+        """Advance by one logic tick of dt seconds, ticking the game once per row due"""
+        self.elapsed += dt
+        interval = self.interval(game, soft_drop)
+        while self.elapsed >= interval and game.state == "playing":
+            self.elapsed -= interval
+            game.tick()
+
+    def progress(self, game, soft_drop=False):
+        """Fraction of the way to the next row (0 to 1), for interpolating the piece"""
+        return min(self.elapsed / self.interval(game, soft_drop), 1.0)
@@ -0,0 +1,106 @@
+"""Evaluate a placement policy over many seeded games in a process pool
+
+Workers are started once and reused for every game; results stream back
+as games finish.
+
+Usage: python tournament.py --policy random --games 2000 --processes 8
+"""
+import argparse
+import multiprocessing
+import os
+import time
+
+from simulate import POLICIES, BOARDS, play_game
+
+# Set in each worker by _init_worker so tasks only carry a seed
+_worker_config = None
+
+
+def _init_worker(policy, width, height, board_cls, max_pieces):
+    global _worker_config
+    _worker_config = (policy, width, height, board_cls, max_pieces)
+
+
+def _play_seed(seed):
+    """Play one game in a worker and return its result record"""
+    policy, width, height, board_cls, max_pieces = _worker_config
+    start = time.perf_counter()
+    game = play_game(policy, seed, width, height, board_cls, max_pieces)
+    return {
+        "seed": seed,
+        "score": game.score,
+        "lines": game.lines,
+        "pieces": game.pieces_placed,
+        "duration": time.perf_counter() - start,
+    }
+
+
+def run_tournament(policy, seeds, processes=None, width=10, height=20,
+                   board_cls=BOARDS["bit"], max_pieces=10000, chunksize=4):
+    """Yield a result dict per game as soon as it finishes
+
+    `policy` must be picklable (a module-level function) because it is sent
+    to every worker once at startup.
+    """
+    initargs = (policy, width, height, board_cls, max_pieces)
+    with multiprocessing.Pool(processes, _init_worker, initargs) as pool:
+        yield from pool.imap_unordered(_play_seed, seeds, chunksize)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0
+    rank = max(1, round(p / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(results, elapsed):
+    """Aggregate result dicts into score statistics and throughput"""
+    scores = sorted(result["score"] for result in results)
+    pieces = sum(result["pieces"] for result in results)
+    games = len(scores)
+    return {
+        "games": games,
+        "mean_score": sum(scores) / games if games else 0,
+        "p50_score": percentile(scores, 50),
+        "p90_score": percentile(scores, 90),
+        "p99_score": percentile(scores, 99),
+        "max_score": scores[-1] if scores else 0,
+        "mean_lines": sum(result["lines"] for result in results) / games if games else 0,
+        "pieces": pieces,
+        "games_per_sec": games / elapsed if elapsed else 0,
+        "pieces_per_sec": pieces / elapsed if elapsed else 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a policy tournament in a process pool")
+    parser.add_argument("--policy", choices=POLICIES, default="random")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--board", choices=BOARDS, default="bit", help="board backend")
+    parser.add_argument("--max-pieces", type=int, default=10000, help="stop a game after this many pieces")
+    parser.add_argument("--verbose", action="store_true", help="print every game as it finishes")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.seed, args.seed + args.games)
+    results = []
+    start = time.perf_counter()
+    for result in run_tournament(POLICIES[args.policy], seeds, args.processes,
+                                 board_cls=BOARDS[args.board], max_pieces=args.max_pieces):
+        results.append(result)
+        if args.verbose:
+            print(f"seed {result['seed']}: score {result['score']}, lines {result['lines']}, "
+                  f"pieces {result['pieces']}, {result['duration'] * 1000:.1f} ms")
+    summary = summarize(results, time.perf_counter() - start)
+
+    print(f"{summary['games']} games on {args.processes} processes")
+    print(f"score mean {summary['mean_score']:.2f}, p50 {summary['p50_score']}, "
+          f"p90 {summary['p90_score']}, p99 {summary['p99_score']}, max {summary['max_score']}")
+    print(f"{summary['games_per_sec']:.1f} games/sec, {summary['pieces_per_sec']:.1f} pieces/sec")
+
+
+if __name__ == "__main__":
+    main()
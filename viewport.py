@@ -0,0 +1,49 @@
+"""Scrolling window onto a board too big to draw whole
+
+A Viewport is the `width` x `height` cells of the board that get drawn,
+starting at column x and row y. follow() scrolls it the least it can to
+keep the falling piece in view, and where the piece will land too when
+both fit, `margin` cells from the edges where possible. Drawing code
+only visits the cells inside it, so a frame costs the same however big
+the board is.
+"""
+
+
+def _scroll(start, size, low, high, limit, margin):
+    """Smallest move of [start, start + size) that shows [low - margin, high + margin], within [0, limit)"""
+    if high - low + 1 + 2 * margin > size:
+        margin = max(0, (size - (high - low + 1)) // 2)
+    if low - margin < start:
+        start = low - margin
+    elif high + margin >= start + size:
+        start = high + margin - size + 1
+    return max(0, min(start, limit - size))
+
+
+class Viewport:
+    """The cells of a board that are drawn: `width` columns from x and `height` rows from y"""
+
+    def __init__(self, width, height, board_width, board_height, margin=3):
+        self.width = min(width, board_width)
+        self.height = min(height, board_height)
+        self.board_width = board_width
+        self.board_height = board_height
+        self.margin = margin
+        self.x = 0
+        self.y = 0
+
+    def contains(self, x, y):
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def follow(self, piece, board):
+        """Scroll to show the piece and, if there is room, its landing spot"""
+        if not piece:
+            return
+        shape = piece.get_shape()
+        self.x = _scroll(self.x, self.width, piece.x + shape.left, piece.x + shape.right,
+                         self.board_width, self.margin)
+        top = piece.y + shape.top
+        landing = piece.y + board.drop_distance(piece) + shape.bottom
+        if landing - top + 1 + 2 * self.margin > self.height:
+            landing = piece.y + shape.bottom  # Too far to show both: follow the piece
+        self.y = _scroll(self.y, self.height, top, landing, self.board_height, self.margin)